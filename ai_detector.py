@@ -1,4 +1,5 @@
-from transformers import pipeline, AutoTokenizer, AutoModelForSequenceClassification
+from transformers import AutoTokenizer, AutoModelForSequenceClassification
+from transformers.utils import is_accelerate_available
 import torch
 from typing import Tuple, Dict, List
 import logging
@@ -6,14 +7,23 @@ import sys
 import argparse
 import json
 from pathlib import Path
-from transformers.pipelines.base import PipelineException
 import numpy as np
 from textstat import textstat
 import re
-import html
 import os
 from typing import Optional
 import hashlib
+import functools
+import contextlib
+import threading
+import weakref
+from collections import OrderedDict
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Listener, Client
+from concurrent.futures import ThreadPoolExecutor
+import tempfile
+import secrets
+from time import monotonic_ns
 
 # Configure logging with security in mind
 logging.basicConfig(
@@ -26,18 +36,209 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Default limit on the number of characters a detector accepts per text
+DEFAULT_MAX_TEXT_LENGTH = 10000
+
+# Default checkpoint for the RoBERTa-style detector. Any sequence-classification
+# checkpoint trained for the same task (e.g. a DistilRoBERTa student distilled
+# from this model) can be swapped in through the ``model_name`` argument.
+DEFAULT_MODEL_NAME = "roberta-base-openai-detector"
+
+# Supported inference backends. "onnx" and "onnx-int8" require optimum[onnxruntime].
+BACKENDS = ("torch", "torch-int8", "onnx", "onnx-int8")
+
+# Maximum number of tokens the detector models see per input
+MAX_INPUT_TOKENS = 512
+
+# Texts with fewer words than this are not classified by the model
+MIN_WORDS = 5
+
+# Result returned without running the model for texts that carry no signal
+TRIVIAL_RESULT = ("Human", 0.5)
+
+# Tokens shared by consecutive windows when a long document is split
+WINDOW_OVERLAP = 32
+
+# Token-length boundaries used to group batched inputs so that texts padded
+# together have similar lengths
+LENGTH_BUCKETS = (32, 64, 128, 256, MAX_INPUT_TOKENS)
+
+# Address of the persistent detector server (see serve())
+if sys.platform == 'win32':
+    DEFAULT_SOCKET = r'\\.\pipe\ai_detector'
+else:
+    # Prefer the per-user runtime directory over the world-writable temp directory
+    DEFAULT_SOCKET = os.path.join(os.environ.get('XDG_RUNTIME_DIR') or tempfile.gettempdir(),
+                                  f"ai_detector_{os.getuid()}.sock")
+
+# Per-user secret both sides of a server connection must know (see _server_authkey())
+SERVER_KEY_FILE = Path.home() / ".cache" / "ai_detector" / "server.key"
+
+# Classifiers shared by every AIDetector in the process, keyed by
+# (model_name, backend, compile_model, max_length), so re-creating a detector (e.g. after a
+# settings change) does not load the weights again. Entries are weak: a classifier
+# is dropped as soon as no live detector uses it, so switching models in the GUI
+# does not keep every earlier model resident.
+_CLASSIFIER_CACHE = weakref.WeakValueDictionary()
+_CLASSIFIER_CACHE_LOCK = threading.Lock()
+
+# Detection results are memoized only for texts up to this many characters,
+# which keeps the cache's memory use bounded
+CACHE_MAX_TEXT_LENGTH = 10 * 1024
+
+# Exported ONNX graphs are cached here so the export runs only once per model
+ONNX_CACHE_DIR = Path.home() / ".cache" / "ai_detector" / "onnx"
+
+# Translation table that deletes null bytes and other control characters
+_CONTROL_CHARS = dict.fromkeys(range(32))
+
+# Translation table equivalent to html.escape(text, quote=True)
+_HTML_ESCAPES = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&#x27;'
+})
+
+# Patterns rejected by _sanitize_input, compiled once into a single
+# alternation so each input is scanned in one pass
+SUSPICIOUS_PATTERNS = [
+    r'<script.*?>.*?</script>',
+    r'javascript:',
+    r'data:text/html',
+    r'eval\s*\(',
+    r'exec\s*\(',
+    r'from\s+os\s+import',
+    r'import\s+os',
+    r'__import__\s*\('
+]
+_SUSPICIOUS_RE = re.compile('|'.join(f'(?:{p})' for p in SUSPICIOUS_PATTERNS), re.IGNORECASE)
+
+@functools.lru_cache(maxsize=1)
+def _cpu_flags() -> frozenset:
+    """Return the CPU feature flags reported by /proc/cpuinfo (empty if unavailable)"""
+    try:
+        with open('/proc/cpuinfo', 'r') as f:
+            for line in f:
+                if line.startswith('flags'):
+                    return frozenset(line.split(':', 1)[1].split())
+    except OSError:
+        pass
+    return frozenset()
+
+@functools.lru_cache(maxsize=1)
+def _configure_torch() -> None:
+    """
+    Configure PyTorch CPU threading once per process.
+    
+    The intra-op thread count comes from AIDETECTOR_THREADS (default: up to 4)
+    so that several detectors or a server process do not oversubscribe cores.
+    """
+    torch.set_num_threads(int(os.getenv("AIDETECTOR_THREADS", min(4, os.cpu_count() or 1))))
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        # Can only be set before any inter-op parallel work has started
+        logger.warning("Could not set PyTorch inter-op threads, parallel work already started")
+    torch.backends.mkldnn.enabled = True
+
+@functools.lru_cache(maxsize=512)
+def _flesch_reading_ease(text: str) -> float:
+    """Memoized textstat.flesch_reading_ease, whose syllable counting is pure Python"""
+    return textstat.flesch_reading_ease(text)
+
+class _Classifier:
+    """A sequence-classification model and the tokenizer it was trained with"""
+    
+    # A plain class rather than a NamedTuple, because tuples cannot be weakly referenced
+    __slots__ = ('model', 'tokenizer', '__weakref__')
+    
+    def __init__(self, model, tokenizer):
+        self.model = model
+        self.tokenizer = tokenizer
+
 class SecurityError(Exception):
     """Custom exception for security-related errors"""
     pass
 
+def validate_file(file_path: str, max_file_size: int, allowed_file_types: Tuple[str, ...],
+                  st: Optional[os.stat_result] = None) -> int:
+    """
+    Validate file before processing.
+    
+    Needs no model, so clients of a detector server can check files too.
+    
+    Args:
+        file_path (str): Path to the file
+        max_file_size (int): Maximum allowed file size in bytes
+        allowed_file_types (Tuple[str, ...]): Accepted lower-case file extensions
+        st (Optional[os.stat_result]): Stat of the file if the caller already
+            has one; it then replaces the existence and size lookups
+        
+    Returns:
+        int: File size in bytes, so callers can skip empty files without reading them
+        
+    Raises:
+        SecurityError: If file validation fails
+    """
+    try:
+        # Check if file exists and is accessible
+        if st is None:
+            if not os.path.exists(file_path):
+                raise SecurityError("File does not exist")
+            file_size = os.path.getsize(file_path)
+        else:
+            file_size = st.st_size
+        
+        # Check file size
+        if file_size > max_file_size:
+            raise SecurityError(f"File size exceeds maximum allowed size of {max_file_size} bytes")
+        
+        # Check file extension
+        if not file_path.lower().endswith(allowed_file_types):
+            raise SecurityError(f"Only {', '.join(allowed_file_types)} files are allowed")
+        
+        # Check file permissions
+        if not os.access(file_path, os.R_OK):
+            raise SecurityError("File is not readable")
+        
+        return file_size
+        
+    except Exception as e:
+        raise SecurityError(f"File validation failed: {str(e)}")
+
 class AIDetector:
-    def __init__(self, max_text_length: int = 10000, max_file_size: int = 1024 * 1024):
+    def __init__(self, max_text_length: int = DEFAULT_MAX_TEXT_LENGTH, max_file_size: int = 1024 * 1024,
+                 model_name: str = DEFAULT_MODEL_NAME, backend: str = "torch",
+                 cache_size: int = 1024, compile_model: bool = False,
+                 compute_readability: bool = True, allowed_file_types: Tuple[str, ...] = ('.txt',),
+                 min_text_length: int = 0):
         """
         Initialize the AI detector with security parameters.
         
         Args:
             max_text_length (int): Maximum allowed text length in characters
             max_file_size (int): Maximum allowed file size in bytes
+            model_name (str): Hugging Face checkpoint used for the detector model.
+                A distilled student (6 layers instead of 12) can be used here
+                to roughly halve inference cost.
+            backend (str): Inference backend, one of BACKENDS. "onnx" runs the
+                detector through ONNX Runtime with graph fusions applied and
+                "onnx-int8" additionally uses dynamically quantized INT8 weights
+                on CPUs with AVX512-VNNI. "torch-int8" quantizes the torch
+                model's Linear layers to INT8 without extra dependencies.
+            cache_size (int): Number of detection results kept in memory so
+                repeated texts skip the models. 0 disables the cache.
+            compile_model (bool): Compile the torch models with TorchInductor.
+                Slows down start-up but fuses ops for faster inference.
+            compute_readability (bool): Compute the Flesch reading ease used to
+                temper confidence for very readable text. Disabling it skips
+                textstat's syllable counting on every call.
+            allowed_file_types (Tuple[str, ...]): File extensions accepted by
+                _validate_file, compared case-insensitively
+            min_text_length (int): Texts with fewer characters get
+                TRIVIAL_RESULT without running the model
             
         Raises:
             RuntimeError: If model initialization fails
@@ -48,39 +249,263 @@ class AIDetector:
             if max_text_length <= 0 or max_file_size <= 0:
                 raise SecurityError("Invalid security parameters")
             
+            if backend not in BACKENDS:
+                raise ValueError(f"Unknown backend '{backend}', expected one of {BACKENDS}")
+            
             self.max_text_length = max_text_length
             self.max_file_size = max_file_size
+            self.model_name = model_name
+            self.backend = backend
+            self.compile_model = compile_model and backend == "torch"
+            self.compute_readability = compute_readability
+            # A tuple lets str.endswith test every extension in one C call
+            self.allowed_file_types = tuple(ext.lower() for ext in allowed_file_types)
+            self.min_text_length = min_text_length
+            
+            _configure_torch()
+            
+            # CPUs with AVX512-BF16 or AMX run the torch backend under BF16 autocast
+            self._use_bf16 = backend == "torch" and bool({'avx512_bf16', 'amx_bf16'} & _cpu_flags())
             
             # Initialize models with security in mind
             self.models = {
-                'gpt2': pipeline(
-                    "text-classification",
-                    model="microsoft/DialogRPT-human-vs-rand",
-                    device=-1,
-                    max_length=512,  # Limit input length
-                    truncation=True
-                ),
-                'roberta': pipeline(
-                    "text-classification",
-                    model="roberta-base-openai-detector",
-                    device=-1,
-                    max_length=512,  # Limit input length
-                    truncation=True
-                )
+                'roberta': self._load_classifier(model_name)
             }
             
-            self.tokenizer = AutoTokenizer.from_pretrained("gpt2")
-            
             # Initialize security-related attributes
-            self._last_request_time = 0
-            self._request_count = 0
             self._rate_limit = 100  # requests per minute
+            self._rate_tokens = float(self._rate_limit)
+            self._rate_last_ns = monotonic_ns()
+            self._rate_lock = threading.Lock()
+            
+            # Bounded LRU cache of detection results keyed by text digest
+            self._cache_size = cache_size
+            self._cache = OrderedDict()
+            self._cache_lock = threading.Lock()
             
             logger.info("AI detector initialized with security parameters")
         except Exception as e:
             logger.error(f"Security initialization failed: {str(e)}")
             raise SecurityError(f"Security initialization failed: {str(e)}")
     
+    def _load_classifier(self, model_name: str, max_length: int = MAX_INPUT_TOKENS):
+        """
+        Load a sequence-classification checkpoint and its tokenizer.
+        
+        Classifiers are cached at module level and shared between detectors.
+        
+        Args:
+            model_name (str): Hugging Face checkpoint name or local path
+            max_length (int): Maximum number of input tokens
+            
+        Returns:
+            _Classifier: Model and tokenizer running on CPU
+        """
+        cache_key = (model_name, self.backend, self.compile_model, max_length)
+        with _CLASSIFIER_CACHE_LOCK:
+            classifier = _CLASSIFIER_CACHE.get(cache_key)
+            if classifier is not None:
+                return classifier
+            
+            # The fast (Rust) tokenizer avoids the slow pure-Python fallback
+            tokenizer = AutoTokenizer.from_pretrained(model_name, use_fast=True)
+            if self.backend in ("onnx", "onnx-int8"):
+                model = self._load_onnx_model(model_name, quantize=self.backend == "onnx-int8")
+            else:
+                load_kwargs = {"torch_dtype": torch.float32}
+                # Allocate weights directly instead of initializing and then overwriting
+                # them; transformers only supports this when accelerate is installed
+                if is_accelerate_available():
+                    load_kwargs["low_cpu_mem_usage"] = True
+                model = AutoModelForSequenceClassification.from_pretrained(model_name, **load_kwargs)
+                if self.backend == "torch-int8":
+                    model = self._quantize_torch_model(model)
+                else:
+                    model = self._optimize_for_cpu(model)
+            
+            # GPT-2 style checkpoints have no pad token, which batching requires
+            if tokenizer.pad_token is None:
+                tokenizer.pad_token = tokenizer.eos_token
+                model.config.pad_token_id = tokenizer.pad_token_id
+            
+            classifier = _Classifier(model, tokenizer)
+            if self.compile_model:
+                self._compile_classifier(classifier, max_length)
+            else:
+                # One short forward pass creates the oneDNN primitives and ONNX Runtime
+                # arenas now, while the GUI is still loading, instead of on the first request
+                self._classify(classifier, "warm up")
+            _CLASSIFIER_CACHE[cache_key] = classifier
+            return classifier
+    
+    def _optimize_for_cpu(self, model):
+        """
+        Repack a torch model's weights into oneDNN's blocked layout if possible.
+        
+        Uses intel_extension_for_pytorch when it is installed, matching the
+        BF16 autocast decision so prepacked weights fit the kernels actually
+        used. Without it the model is converted to BetterTransformer if
+        possible, otherwise it is returned unchanged.
+        
+        Args:
+            model (PreTrainedModel): Model loaded on CPU
+            
+        Returns:
+            PreTrainedModel: The optimized (or original) model in eval mode
+        """
+        model.eval()
+        try:
+            import intel_extension_for_pytorch as ipex
+        except ImportError:
+            return self._to_bettertransformer(model)
+        
+        dtype = torch.bfloat16 if self._use_bf16 else torch.float32
+        model = ipex.optimize(model, dtype=dtype, level="O1", inplace=True)
+        logger.info("Optimized model weights with Intel Extension for PyTorch")
+        return model
+    
+    def _to_bettertransformer(self, model):
+        """
+        Swap the encoder layers for BetterTransformer's fused fastpath.
+        
+        The fastpath runs fused attention kernels and, for padded batches,
+        uses nested tensors so no compute is spent on pad tokens. Requires
+        optimum; recent transformers versions that already use SDPA for the
+        model reject the conversion, and models without a
+        to_bettertransformer method cannot be converted at all; in both
+        cases the model is kept as is.
+        
+        Args:
+            model (PreTrainedModel): Model in eval mode
+            
+        Returns:
+            PreTrainedModel: The converted (or original) model
+        """
+        if not hasattr(model, "to_bettertransformer"):
+            logger.info("BetterTransformer not used: model has no to_bettertransformer method")
+            return model
+        try:
+            model = model.to_bettertransformer()
+        except (ImportError, ValueError, NotImplementedError) as e:
+            logger.info(f"BetterTransformer not used: {str(e)}")
+            return model
+        logger.info("Converted model to BetterTransformer")
+        return model
+    
+    def _quantize_torch_model(self, model):
+        """
+        Apply dynamic INT8 quantization to a torch model's Linear layers.
+        
+        Weights are stored as INT8 and activations are quantized on the fly,
+        which cuts the weight bytes read per forward pass by about 4x. Uses
+        the fbgemm kernels, which take advantage of VNNI when the CPU has it.
+        
+        Args:
+            model (PreTrainedModel): FP32 model loaded on CPU
+            
+        Returns:
+            PreTrainedModel: Quantized model in eval mode
+        """
+        model.eval()
+        model = torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        logger.info("Quantized model Linear layers to INT8")
+        return model
+    
+    def _compile_classifier(self, classifier, max_length: int) -> None:
+        """
+        Compile a classifier's model forward with TorchInductor and warm it up.
+        
+        dynamic=True avoids a recompile for every new sequence length and
+        max-autotune lets Inductor benchmark its CPU GEMM templates against
+        the library kernels. The warm-up pass on a max-length input triggers compilation at start-up
+        instead of on the first real request.
+        
+        Args:
+            classifier (_Classifier): Classifier whose model should be compiled
+            max_length (int): Maximum number of input tokens
+        """
+        model = classifier.model
+        model.forward = torch.compile(model.forward, backend="inductor", mode="max-autotune", dynamic=True)
+        self._classify(classifier, "warm up " * max_length)
+        logger.info("Compiled model with TorchInductor")
+    
+    def _load_onnx_model(self, model_name: str, quantize: bool = False):
+        """
+        Load an optimized ONNX Runtime version of a checkpoint.
+        
+        The checkpoint is exported and optimized (LayerNorm, GELU, attention
+        and skip-connection fusions) once, then reused from ONNX_CACHE_DIR.
+        
+        Args:
+            model_name (str): Hugging Face checkpoint name or local path
+            quantize (bool): Use dynamic INT8 quantization. Only applied on
+                CPUs with AVX512-VNNI, older CPUs keep the FP32 graph.
+            
+        Returns:
+            ORTModelForSequenceClassification: ONNX Runtime model on CPU
+        """
+        from optimum.onnxruntime import ORTModelForSequenceClassification, ORTOptimizer
+        from optimum.onnxruntime.configuration import OptimizationConfig
+        
+        export_dir = ONNX_CACHE_DIR / model_name.replace('/', '--')
+        if not (export_dir / "model_optimized.onnx").exists():
+            logger.info(f"Exporting {model_name} to ONNX (one-time step)")
+            model = ORTModelForSequenceClassification.from_pretrained(model_name, export=True)
+            optimizer = ORTOptimizer.from_pretrained(model)
+            optimizer.optimize(
+                save_dir=export_dir,
+                optimization_config=OptimizationConfig(
+                    optimization_level=99,
+                    optimize_for_gpu=False,
+                    fp16=False
+                )
+            )
+        
+        file_name = "model_optimized.onnx"
+        if quantize:
+            if 'avx512_vnni' in _cpu_flags():
+                file_name = self._quantize_onnx_model(export_dir, file_name)
+            else:
+                logger.warning("CPU lacks AVX512-VNNI, using the FP32 ONNX model instead of INT8")
+        
+        # Match torch's thread budget (see _configure_torch); the graph is
+        # already optimized on disk, ORT_ENABLE_ALL adds its runtime-only fusions
+        import onnxruntime
+        session_options = onnxruntime.SessionOptions()
+        session_options.intra_op_num_threads = torch.get_num_threads()
+        session_options.inter_op_num_threads = 1
+        session_options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        
+        return ORTModelForSequenceClassification.from_pretrained(
+            export_dir,
+            file_name=file_name,
+            session_options=session_options
+        )
+    
+    def _quantize_onnx_model(self, export_dir: Path, file_name: str) -> str:
+        """
+        Apply dynamic INT8 quantization to an exported ONNX model.
+        
+        Args:
+            export_dir (Path): Directory containing the exported model
+            file_name (str): ONNX file to quantize
+            
+        Returns:
+            str: File name of the quantized model inside export_dir
+        """
+        from optimum.onnxruntime import ORTQuantizer
+        from optimum.onnxruntime.configuration import AutoQuantizationConfig
+        
+        quantized_name = f"{Path(file_name).stem}_quantized.onnx"
+        if not (export_dir / quantized_name).exists():
+            logger.info("Quantizing ONNX model to INT8 (one-time step)")
+            quantizer = ORTQuantizer.from_pretrained(export_dir, file_name=file_name)
+            quantizer.quantize(
+                save_dir=export_dir,
+                quantization_config=AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+            )
+        return quantized_name
+    
     def _sanitize_input(self, text: str) -> str:
         """
         Sanitize input text to prevent injection attacks.
@@ -95,84 +520,62 @@ class AIDetector:
             SecurityError: If text contains suspicious patterns
         """
         # Remove null bytes and control characters
-        text = ''.join(char for char in text if ord(char) >= 32)
+        text = text.translate(_CONTROL_CHARS)
         
         # Check for suspicious patterns
-        suspicious_patterns = [
-            r'<script.*?>.*?</script>',
-            r'javascript:',
-            r'data:text/html',
-            r'eval\s*\(',
-            r'exec\s*\(',
-            r'from\s+os\s+import',
-            r'import\s+os',
-            r'__import__\s*\('
-        ]
-        
-        for pattern in suspicious_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                raise SecurityError("Suspicious pattern detected in input")
+        if _SUSPICIOUS_RE.search(text):
+            raise SecurityError("Suspicious pattern detected in input")
         
-        # HTML escape the text
-        text = html.escape(text)
+        # HTML escape the text in a single pass
+        text = text.translate(_HTML_ESCAPES)
         
         return text
     
-    def _validate_file(self, file_path: str) -> None:
+    def _validate_file(self, file_path: str, st: Optional[os.stat_result] = None) -> int:
         """
-        Validate file before processing.
+        Validate file before processing against this detector's limits.
         
         Args:
             file_path (str): Path to the file
+            st (Optional[os.stat_result]): Stat of the file if the caller already has one
+            
+        Returns:
+            int: File size in bytes
             
         Raises:
             SecurityError: If file validation fails
         """
-        try:
-            # Check if file exists and is accessible
-            if not os.path.exists(file_path):
-                raise SecurityError("File does not exist")
-            
-            # Check file size
-            file_size = os.path.getsize(file_path)
-            if file_size > self.max_file_size:
-                raise SecurityError(f"File size exceeds maximum allowed size of {self.max_file_size} bytes")
-            
-            # Check file extension
-            if not file_path.lower().endswith('.txt'):
-                raise SecurityError("Only .txt files are allowed")
-            
-            # Check file permissions
-            if not os.access(file_path, os.R_OK):
-                raise SecurityError("File is not readable")
-            
-        except Exception as e:
-            raise SecurityError(f"File validation failed: {str(e)}")
+        return validate_file(file_path, self.max_file_size, self.allowed_file_types, st)
     
     def _check_rate_limit(self) -> None:
         """
         Implement rate limiting to prevent abuse.
         
+        Uses a token bucket that refills continuously at _rate_limit tokens
+        per minute on the monotonic clock, allowing bursts of up to
+        _rate_limit requests.
+        
         Raises:
             SecurityError: If rate limit is exceeded
         """
-        import time
-        current_time = time.time()
-        
-        # Reset counter if more than a minute has passed
-        if current_time - self._last_request_time > 60:
-            self._request_count = 0
-            self._last_request_time = current_time
-        
-        # Check rate limit
-        self._request_count += 1
-        if self._request_count > self._rate_limit:
-            raise SecurityError("Rate limit exceeded")
+        with self._rate_lock:
+            now = monotonic_ns()
+            self._rate_tokens = min(
+                self._rate_limit,
+                self._rate_tokens + (now - self._rate_last_ns) * self._rate_limit / 60e9
+            )
+            self._rate_last_ns = now
+            
+            if self._rate_tokens < 1:
+                raise SecurityError("Rate limit exceeded")
+            self._rate_tokens -= 1
     
     def _analyze_text_features(self, text: str) -> Dict[str, float]:
         """
         Analyze various text features that might indicate AI generation.
         
+        Only features consumed by _combine are computed.
+        
         Args:
             text (str): The text to analyze
             
@@ -181,27 +584,92 @@ class AIDetector:
         """
         features = {}
         
-        # Calculate perplexity-like score
-        tokens = self.tokenizer(text, return_tensors="pt")
-        input_ids = tokens["input_ids"]
-        attention_mask = tokens["attention_mask"]
+        # Calculate text statistics
+        if self.compute_readability:
+            features['readability'] = _flesch_reading_ease(text)
         
-        # Calculate average token probability
-        with torch.no_grad():
-            outputs = self.models['gpt2'].model(input_ids, attention_mask=attention_mask)
-            logits = outputs.logits
-            probs = torch.softmax(logits, dim=-1)
-            avg_prob = probs.mean().item()
+        return features
+    
+    @contextlib.contextmanager
+    def _inference_context(self):
+        """
+        Context for model forward passes.
         
-        features['token_probability'] = avg_prob
+        Disables autograd tracking and, on CPUs with AVX512-BF16 or AMX, runs matmuls
+        in bfloat16 via autocast. Autocast keeps precision-sensitive ops such
+        as LayerNorm and softmax in float32.
+        """
+        with torch.inference_mode():
+            if self._use_bf16:
+                with torch.autocast("cpu", dtype=torch.bfloat16):
+                    yield
+            else:
+                yield
+    
+    def _prepare_text(self, text: str) -> str:
+        """
+        Run the rate limit, validation and sanitization checks on an input.
         
-        # Calculate text statistics
-        features['readability'] = textstat.flesch_reading_ease(text)
-        features['sentence_length'] = len(re.split(r'[.!?]+', text))
-        features['word_length'] = len(text.split())
-        features['avg_word_length'] = np.mean([len(word) for word in text.split()])
+        Args:
+            text (str): The text to analyze
+            
+        Returns:
+            str: Sanitized text ready for the models
+            
+        Raises:
+            SecurityError: If security checks fail
+            ValueError: If input text is empty or invalid
+        """
+        # Security: Check rate limit
+        self._check_rate_limit()
         
-        return features
+        # Security: Validate input
+        if not isinstance(text, str):
+            raise ValueError("Input must be a string")
+        
+        if not text.strip():
+            raise ValueError("Input text cannot be empty")
+        
+        if len(text) > self.max_text_length:
+            raise SecurityError(f"Text length exceeds maximum allowed length of {self.max_text_length} characters")
+        
+        # Security: Sanitize input
+        text = self._sanitize_input(text)
+        
+        if len(text) < 10:
+            logger.warning("Input text is very short, which may affect detection accuracy")
+        
+        return text
+    
+    def _combine(self, results: List[Dict[str, any]], features: Dict[str, float]) -> Tuple[str, float]:
+        """
+        Combine the per-model classifier outputs and text features into a final prediction.
+        
+        The ensemble works in probability space: each model's output is turned
+        into a probability of the text being AI-generated and these are averaged.
+        
+        Args:
+            results (List[Dict[str, any]]): One classifier result per model
+            features (Dict[str, float]): Output of _analyze_text_features
+            
+        Returns:
+            Tuple[str, float]: A tuple containing the prediction label and confidence score
+        """
+        # Average the models' AI probabilities instead of voting on their labels
+        p_ai = float(np.mean([
+            result["score"] if result["label"] == "LABEL_1" else 1.0 - result["score"]
+            for result in results
+        ]))
+        
+        # Very readable text lowers confidence; shrinking towards 0.5 keeps the
+        # probability within [0, 1] without clamping
+        if features.get('readability', 0) > 80:
+            p_ai = 0.5 + (p_ai - 0.5) * 0.8
+        
+        final_label = "AI" if p_ai > 0.5 else "Human"
+        final_confidence = p_ai if final_label == "AI" else 1.0 - p_ai
+        
+        return final_label, final_confidence
     
     def detect(self, text: str) -> Tuple[str, float]:
         """
@@ -219,102 +687,591 @@ class AIDetector:
             RuntimeError: If detection fails
         """
         try:
-            # Security: Check rate limit
-            self._check_rate_limit()
-            
-            # Security: Validate input
-            if not isinstance(text, str):
-                raise ValueError("Input must be a string")
+            text = self._prepare_text(text)
+            return self._detect_prepared(text)
             
-            if not text.strip():
-                raise ValueError("Input text cannot be empty")
-            
-            if len(text) > self.max_text_length:
-                raise SecurityError(f"Text length exceeds maximum allowed length of {self.max_text_length} characters")
-            
-            # Security: Sanitize input
-            text = self._sanitize_input(text)
+        except SecurityError as e:
+            logger.error(f"Security error during detection: {str(e)}")
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error during detection: {str(e)}")
+            raise RuntimeError(f"An unexpected error occurred: {str(e)}")
+    
+    def _detect_prepared(self, text: str) -> Tuple[str, float]:
+        """
+        Run the models on an already validated and sanitized text.
+        
+        Args:
+            text (str): Sanitized text
             
-            # Rest of the detection logic remains the same
-            if len(text) < 10:
-                logger.warning("Input text is very short, which may affect detection accuracy")
+        Returns:
+            Tuple[str, float]: A tuple containing the prediction label and confidence score
+        """
+        trivial = self._trivial_classify(text)
+        if trivial is not None:
+            return trivial
+        
+        cache_key = self._cache_key(text)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            logger.info(f"Detection served from cache: {cached[0]} (Confidence: {cached[1]:.2f})")
+            return cached
+        
+        # Get predictions from each model
+        results = [self._classify(classifier, text) for classifier in self.models.values()]
+        
+        # Analyze text features
+        features = self._analyze_text_features(text)
+        
+        final_label, final_confidence = self._combine(results, features)
+        self._cache_put(cache_key, (final_label, final_confidence))
+        
+        # Log the detection result (without sensitive data)
+        logger.info(f"Detection completed: {final_label} (Confidence: {final_confidence:.2f})")
+        return final_label, final_confidence
+    
+    def detect_document(self, text: str, batch_size: int = 8) -> Tuple[str, float]:
+        """
+        Detect AI content in a document that may exceed the models' input length.
+        
+        Instead of truncating, documents longer than MAX_INPUT_TOKENS are split
+        into overlapping windows that are classified in batches, and the AI
+        probabilities of all windows are averaged.
+        
+        Args:
+            text (str): The document to analyze
+            batch_size (int): Number of windows per forward pass
             
-            # Get predictions from multiple models
-            predictions = []
-            confidences = []
+        Returns:
+            Tuple[str, float]: A tuple containing the prediction label and confidence score
             
-            for model_name, model in self.models.items():
-                result = model(text)[0]
-                label = "AI" if result["label"] == "LABEL_1" else "Human"
-                confidence = result["score"]
-                predictions.append(label)
-                confidences.append(confidence)
+        Raises:
+            SecurityError: If security checks fail
+            RuntimeError: If detection fails
+        """
+        try:
+            text = self._prepare_text(text)
+            windows = self._split_windows(text)
+            if len(windows) == 1:
+                return self._detect_prepared(text)
             
-            # Analyze text features
+            buckets, encodings = self._length_buckets(windows, batch_size)
+            results = [
+                result
+                for model in self.models.values()
+                for result in self._batched_results(model, encodings, buckets)
+            ]
             features = self._analyze_text_features(text)
+            final_label, final_confidence = self._combine(results, features)
             
-            # Calculate final score using ensemble method
-            final_confidence = np.mean(confidences)
-            
-            # Adjust confidence based on text features
-            if features['token_probability'] > 0.5:
-                final_confidence *= 1.2
-            if features['readability'] > 80:
-                final_confidence *= 0.8
-            
-            # Determine final label
-            ai_count = predictions.count("AI")
-            human_count = predictions.count("Human")
-            
-            if ai_count > human_count:
-                final_label = "AI"
-            else:
-                final_label = "Human"
-            
-            # Ensure confidence is between 0 and 1
-            final_confidence = min(max(final_confidence, 0), 1)
-            
-            # Log the detection result (without sensitive data)
-            logger.info(f"Detection completed: {final_label} (Confidence: {final_confidence:.2f})")
+            logger.info(f"Document detection completed over {len(windows)} windows: "
+                        f"{final_label} (Confidence: {final_confidence:.2f})")
             return final_label, final_confidence
             
         except SecurityError as e:
             logger.error(f"Security error during detection: {str(e)}")
             raise
-        except PipelineException as e:
-            logger.error(f"Pipeline error during detection: {str(e)}")
-            raise RuntimeError(f"Failed to process text: {str(e)}")
         except Exception as e:
             logger.error(f"Unexpected error during detection: {str(e)}")
             raise RuntimeError(f"An unexpected error occurred: {str(e)}")
+    
+    def _split_windows(self, text: str) -> List[str]:
+        """
+        Split a text into overlapping windows that each fit in MAX_INPUT_TOKENS.
+        
+        Args:
+            text (str): Sanitized text
+            
+        Returns:
+            List[str]: The text itself if it fits, otherwise its windows
+        """
+        tokenizer = self.models['roberta'].tokenizer
+        ids = tokenizer(text, add_special_tokens=False)["input_ids"]
+        window = MAX_INPUT_TOKENS - tokenizer.num_special_tokens_to_add()
+        if len(ids) <= window:
+            return [text]
+        
+        step = window - WINDOW_OVERLAP
+        return [tokenizer.decode(ids[start:start + window]) for start in range(0, len(ids) - WINDOW_OVERLAP, step)]
 
-    def batch_detect(self, texts: List[str]) -> List[Dict[str, any]]:
+    def batch_detect(self, texts: List[str], batch_size: int = 16, documents: bool = False) -> List[Dict[str, any]]:
         """
         Process multiple texts in batch.
         
+        Valid texts are run through each model in padded batches instead of
+        one forward pass per text. Texts found in the result cache and
+        repeated texts within the batch are only classified once. Inputs that
+        fail validation are reported individually without affecting the rest
+        of the batch.
+        
         Args:
             texts (List[str]): List of texts to analyze
+            batch_size (int): Number of texts per forward pass
+            documents (bool): Treat texts as documents like detect_document(),
+                splitting long ones into windows instead of truncating them.
+                Windows of all documents are batched together.
             
         Returns:
             List[Dict[str, any]]: List of results with predictions and confidence scores
         """
-        results = []
-        for i, text in enumerate(texts, 1):
+        results = [None] * len(texts)
+        prepared = []  # Distinct sanitized texts that need the models
+        positions = {}  # Sanitized text -> indices into texts
+        for i, text in enumerate(texts):
             try:
-                label, confidence = self.detect(text)
-                results.append({
-                    "text": text[:100] + "..." if len(text) > 100 else text,
-                    "prediction": label,
-                    "confidence": confidence,
-                    "status": "success"
-                })
+                sanitized = self._prepare_text(text)
             except Exception as e:
-                results.append({
-                    "text": text[:100] + "..." if len(text) > 100 else text,
-                    "error": str(e),
-                    "status": "error"
-                })
+                results[i] = self._error_result(text, e)
+                continue
+            
+            known = self._trivial_classify(sanitized)
+            if known is None and not documents:
+                known = self._cache_get(self._cache_key(sanitized))
+            if known is not None:
+                results[i] = self._success_result(text, *known)
+            elif sanitized in positions:
+                positions[sanitized].append(i)
+            else:
+                positions[sanitized] = [i]
+                prepared.append(sanitized)
+        
+        # Each prepared text contributes one segment, or one per window for documents
+        segments = []
+        owners = []
+        for j, text in enumerate(prepared):
+            windows = self._split_windows(text) if documents else [text]
+            segments.extend(windows)
+            owners.extend([j] * len(windows))
+        
+        try:
+            buckets, encodings = self._length_buckets(segments, batch_size)
+            outputs = [[] for _ in prepared]
+            for model in self.models.values():
+                for owner, result in zip(owners, self._batched_results(model, encodings, buckets)):
+                    outputs[owner].append(result)
+        except Exception as e:
+            logger.error(f"Batch inference failed: {str(e)}")
+            for text in prepared:
+                for i in positions[text]:
+                    results[i] = self._error_result(texts[i], e)
+            return results
+        
+        for j, text in enumerate(prepared):
+            try:
+                features = self._analyze_text_features(text)
+                label, confidence = self._combine(outputs[j], features)
+                if not documents:
+                    self._cache_put(self._cache_key(text), (label, confidence))
+                for i in positions[text]:
+                    results[i] = self._success_result(texts[i], label, confidence)
+            except Exception as e:
+                for i in positions[text]:
+                    results[i] = self._error_result(texts[i], e)
+        
+        logger.info(f"Batch detection completed for {len(texts)} texts")
         return results
+    
+    def _classify(self, classifier: _Classifier, text: str) -> Dict[str, any]:
+        """
+        Run one classifier on a single text.
+        
+        The text is tokenized once and passed straight to the model. Inputs
+        beyond MAX_INPUT_TOKENS are truncated so attention cost stays bounded.
+        
+        Args:
+            classifier (_Classifier): Model and tokenizer to use
+            text (str): Sanitized text
+            
+        Returns:
+            Dict[str, any]: {"label", "score"} result for the text
+        """
+        inputs = classifier.tokenizer(text, truncation=True, max_length=MAX_INPUT_TOKENS, return_tensors="pt")
+        with self._inference_context():
+            logits = classifier.model(**inputs).logits.float()
+        return self._logits_to_results(classifier, logits)[0]
+    
+    def _logits_to_results(self, classifier: _Classifier, logits: torch.Tensor) -> List[Dict[str, any]]:
+        """
+        Turn a batch of logits into {"label", "score"} results.
+        
+        Uses sigmoid for single-logit heads and softmax otherwise, matching
+        the transformers text-classification pipeline.
+        
+        Args:
+            classifier (_Classifier): Classifier that produced the logits
+            logits (torch.Tensor): Logits of shape (batch, num_labels)
+            
+        Returns:
+            List[Dict[str, any]]: One result per row of logits
+        """
+        if logits.shape[-1] == 1:
+            probs = torch.sigmoid(logits)
+        else:
+            probs = torch.softmax(logits, dim=-1)
+        scores, label_ids = probs.max(dim=-1)
+        
+        id2label = classifier.model.config.id2label
+        return [
+            {"label": id2label[label_id], "score": score}
+            for score, label_id in zip(scores.tolist(), label_ids.tolist())
+        ]
+    
+    def _batched_results(self, classifier: _Classifier, encodings, buckets: List[List[int]]) -> List[Dict[str, any]]:
+        """
+        Run one classifier over pre-tokenized texts in the given batches.
+        
+        Each batch is padded to its longest member in-process from the
+        encodings made by _length_buckets, and all probabilities are computed
+        with a single softmax over the concatenated logits.
+        
+        Args:
+            classifier (_Classifier): Model and tokenizer to use
+            encodings (BatchEncoding): Unpadded encodings of the texts from _length_buckets
+            buckets (List[List[int]]): Batches of indices into the encodings
+            
+        Returns:
+            List[Dict[str, any]]: {"label", "score"} results in input order
+        """
+        if not buckets:
+            return []
+        
+        features = [key for key in encodings.keys() if key != "length"]
+        logits = []
+        with self._inference_context():
+            for bucket in buckets:
+                batch = classifier.tokenizer.pad(
+                    {key: [encodings[key][idx] for idx in bucket] for key in features},
+                    return_tensors="pt"
+                )
+                logits.append(classifier.model(**batch).logits.float())
+        
+        order = [idx for bucket in buckets for idx in bucket]
+        results = [None] * len(order)
+        for idx, result in zip(order, self._logits_to_results(classifier, torch.cat(logits))):
+            results[idx] = result
+        return results
+    
+    def _trivial_classify(self, text: str) -> Optional[Tuple[str, float]]:
+        """
+        Recognize inputs for which a model prediction carries no signal.
+        
+        Texts below min_text_length characters or MIN_WORDS words, texts
+        made only of URLs and texts made only of single characters get
+        TRIVIAL_RESULT without running the model. The length check comes
+        first because it needs no scan of the text.
+        
+        Args:
+            text (str): Sanitized text
+            
+        Returns:
+            Optional[Tuple[str, float]]: TRIVIAL_RESULT, or None if the model should run
+        """
+        if len(text) < self.min_text_length:
+            logger.info("Input too short for the model, skipping inference")
+            return TRIVIAL_RESULT
+        words = text.split()
+        if (len(words) < MIN_WORDS
+                or all(word.startswith(("http://", "https://")) for word in words)
+                or all(len(word) == 1 for word in words)):
+            logger.info("Input too short or uninformative for the model, skipping inference")
+            return TRIVIAL_RESULT
+        return None
+    
+    def _cache_key(self, text: str) -> Optional[bytes]:
+        """Return the cache key for a sanitized text, or None if it should not be cached"""
+        if not self._cache_size or len(text) > CACHE_MAX_TEXT_LENGTH:
+            return None
+        return hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+    
+    def _cache_get(self, key: Optional[bytes]) -> Optional[Tuple[str, float]]:
+        """Look up a cached detection result and mark it as recently used"""
+        if key is None:
+            return None
+        with self._cache_lock:
+            result = self._cache.get(key)
+            if result is not None:
+                self._cache.move_to_end(key)
+            return result
+    
+    def _cache_put(self, key: Optional[bytes], result: Tuple[str, float]) -> None:
+        """Store a detection result, evicting the least recently used entry when full"""
+        if key is None:
+            return
+        with self._cache_lock:
+            self._cache[key] = result
+            self._cache.move_to_end(key)
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+    
+    def _length_buckets(self, texts: List[str], batch_size: int) -> Tuple[List[List[int]], any]:
+        """
+        Tokenize texts once and group them into batches of similar token length.
+        
+        Padding a batch to its longest member makes attention cost grow with
+        the longest text, so texts are sorted by token count and only batched
+        with others that fall in the same LENGTH_BUCKETS range. The encodings
+        are returned so the forward passes reuse them instead of tokenizing
+        again.
+        
+        Args:
+            texts (List[str]): Sanitized texts
+            batch_size (int): Maximum number of texts per batch
+            
+        Returns:
+            Tuple[List[List[int]], BatchEncoding]: Indices into texts, one list
+                per batch, and the unpadded encodings of texts
+        """
+        if not texts:
+            return [], None
+        
+        tokenizer = self.models['roberta'].tokenizer
+        encodings = tokenizer(texts, truncation=True, max_length=MAX_INPUT_TOKENS, return_length=True)
+        lengths = encodings["length"]
+        
+        buckets = []
+        current = []
+        current_bound = None
+        for idx in np.argsort(lengths, kind='stable'):
+            bound = next(b for b in LENGTH_BUCKETS if lengths[idx] <= b)
+            if current and (bound != current_bound or len(current) == batch_size):
+                buckets.append(current)
+                current = []
+            current.append(int(idx))
+            current_bound = bound
+        buckets.append(current)
+        return buckets, encodings
+    
+    @staticmethod
+    def _preview(text: any) -> str:
+        """Shorten a text for inclusion in batch results"""
+        text = str(text)
+        return text[:100] + "..." if len(text) > 100 else text
+    
+    def _success_result(self, text: str, label: str, confidence: float) -> Dict[str, any]:
+        """Build a batch result entry for a successfully analyzed text"""
+        return {
+            "text": self._preview(text),
+            "prediction": label,
+            "confidence": confidence,
+            "status": "success"
+        }
+    
+    def _error_result(self, text: any, error: Exception) -> Dict[str, any]:
+        """Build a batch result entry for a text that could not be analyzed"""
+        return {
+            "text": self._preview(text),
+            "error": str(error),
+            "security": isinstance(error, SecurityError),
+            "status": "error"
+        }
+
+def _server_authkey(create: bool = False) -> bytes:
+    """
+    Return the per-user secret that authenticates detector server connections.
+    
+    Only serve() creates the key file, with owner-only permissions; clients
+    just read it. Client and server each prove they know the key, so another
+    local user can neither query the server nor impersonate one on the
+    socket address.
+    
+    Args:
+        create (bool): Create the key file if it does not exist yet
+    
+    Returns:
+        bytes: The shared secret
+        
+    Raises:
+        FileNotFoundError: If the key file does not exist and create is False
+        SecurityError: If the key file is accessible to other users
+    """
+    if create and not SERVER_KEY_FILE.exists():
+        SERVER_KEY_FILE.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        # Write the key to a private temporary file and link it into place, so
+        # a concurrent reader never sees a partially written key
+        fd, tmp_path = tempfile.mkstemp(dir=SERVER_KEY_FILE.parent)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(secrets.token_bytes(32))
+            try:
+                os.link(tmp_path, SERVER_KEY_FILE)
+            except FileExistsError:
+                pass  # Another process created it first; use that key
+        finally:
+            os.unlink(tmp_path)
+    
+    if sys.platform != 'win32':
+        st = os.stat(SERVER_KEY_FILE)
+        if st.st_uid != os.getuid() or st.st_mode & 0o077:
+            raise SecurityError(f"{SERVER_KEY_FILE} must be owned by the current user and not accessible to others")
+    return SERVER_KEY_FILE.read_bytes()
+
+def _server_options(detector: AIDetector) -> Dict[str, any]:
+    """Return the detector settings a client must match to use a server"""
+    return {
+        "model_name": detector.model_name,
+        "backend": detector.backend,
+        "compute_readability": detector.compute_readability
+    }
+
+def serve(detector: AIDetector, address: str = DEFAULT_SOCKET) -> None:
+    """
+    Keep a detector resident and answer detection requests over a local socket.
+    
+    Requests and responses are JSON documents so that nothing received from a
+    client is ever unpickled. Connections are authenticated with the per-user
+    key from _server_authkey(), and on POSIX the socket is created with
+    owner-only permissions. Requests made with other detector settings than
+    the server's are rejected.
+    
+    Args:
+        detector (AIDetector): Initialized AI detector instance
+        address (str): Unix socket path or Windows named pipe to listen on
+    """
+    authkey = _server_authkey(create=True)
+    if sys.platform != 'win32':
+        if os.path.exists(address):
+            os.unlink(address)  # Stale socket from a previous server
+        old_umask = os.umask(0o177)
+        try:
+            listener = Listener(address, authkey=authkey)
+        finally:
+            os.umask(old_umask)
+    else:
+        listener = Listener(address, authkey=authkey)
+    
+    options = _server_options(detector)
+    max_request_bytes = detector.max_text_length * 4 + 1024
+    logger.info(f"Detector server listening on {address}")
+    try:
+        while True:
+            try:
+                conn = listener.accept()
+            except (AuthenticationError, EOFError, ConnectionError):
+                logger.warning("Rejected a detector server connection that failed authentication")
+                continue
+            
+            with conn:
+                try:
+                    request = json.loads(conn.recv_bytes(max_request_bytes))
+                except (EOFError, OSError, ValueError):
+                    continue  # Client hung up or sent a malformed request
+                
+                try:
+                    if request.get("options") != options:
+                        response = {"error": f"Detector server runs different settings: {options}", "mismatch": True}
+                    elif request.get("probe"):
+                        response = {"ok": True}
+                    else:
+                        method = detector.detect_document if request.get("document") else detector.detect
+                        label, confidence = method(request.get("text"))
+                        response = {"label": label, "confidence": confidence}
+                except SecurityError as e:
+                    response = {"error": str(e), "security": True}
+                except Exception as e:
+                    response = {"error": str(e)}
+                
+                try:
+                    conn.send_bytes(json.dumps(response).encode('utf-8'))
+                except OSError as e:
+                    logger.warning(f"Failed to send response: {str(e)}")
+    except KeyboardInterrupt:
+        logger.info("Detector server stopped")
+    finally:
+        listener.close()
+
+class RemoteDetector:
+    """Thin client with the AIDetector detection interface that forwards requests to serve()"""
+    
+    def __init__(self, address: str = DEFAULT_SOCKET, options: Optional[Dict[str, any]] = None,
+                 max_text_length: int = DEFAULT_MAX_TEXT_LENGTH, max_file_size: int = 1024 * 1024,
+                 allowed_file_types: Tuple[str, ...] = ('.txt',)):
+        """
+        Args:
+            address (str): Unix socket path or Windows named pipe of the server
+            options (Optional[Dict[str, any]]): model_name, backend and
+                compute_readability the server must be running with; defaults
+                to AIDetector's defaults
+            max_text_length (int): Only used to bound client-side file reads;
+                the server enforces its own limit
+            max_file_size (int): Maximum allowed file size in bytes
+            allowed_file_types (Tuple[str, ...]): File extensions accepted by
+                _validate_file, compared case-insensitively
+        """
+        self.address = address
+        self.options = options or {
+            "model_name": DEFAULT_MODEL_NAME,
+            "backend": "torch",
+            "compute_readability": True
+        }
+        self.max_text_length = max_text_length
+        self.max_file_size = max_file_size
+        self.allowed_file_types = tuple(ext.lower() for ext in allowed_file_types)
+    
+    def is_available(self) -> bool:
+        """Check whether an authenticated server with matching settings is listening on the address"""
+        try:
+            response = self._send({"probe": True})
+        except SecurityError as e:
+            logger.warning(f"Not using the detector server: {str(e)}")
+            return False
+        except (OSError, EOFError, ValueError, AuthenticationError):
+            return False
+        if response.get("mismatch"):
+            logger.info(f"Not using the detector server at {self.address}: {response['error']}")
+        return bool(response.get("ok"))
+    
+    def _validate_file(self, file_path: str, st: Optional[os.stat_result] = None) -> int:
+        """Validate a file with the same checks as AIDetector._validate_file, before it is read"""
+        return validate_file(file_path, self.max_file_size, self.allowed_file_types, st)
+    
+    def detect(self, text: str) -> Tuple[str, float]:
+        """Detect AI content using the server's detect()"""
+        return self._request(text, document=False)
+    
+    def detect_document(self, text: str) -> Tuple[str, float]:
+        """Detect AI content using the server's detect_document()"""
+        return self._request(text, document=True)
+    
+    def _send(self, request: Dict[str, any]) -> Dict[str, any]:
+        """Send one request with this client's options over an authenticated connection"""
+        # Without a server socket there is nothing to connect to, so the key is not read
+        if sys.platform != 'win32' and not os.path.exists(self.address):
+            raise FileNotFoundError(f"No detector server socket at {self.address}")
+        with Client(self.address, authkey=_server_authkey()) as conn:
+            conn.send_bytes(json.dumps({**request, "options": self.options}).encode('utf-8'))
+            return json.loads(conn.recv_bytes())
+    
+    def _request(self, text: str, document: bool) -> Tuple[str, float]:
+        response = self._send({"text": text, "document": document})
+        
+        if "error" in response:
+            if response.get("security"):
+                raise SecurityError(response["error"])
+            raise RuntimeError(response["error"])
+        return response["label"], response["confidence"]
+
+def read_text_file(file_path: str, max_chars: int) -> str:
+    """
+    Read at most max_chars + 1 characters from a text file.
+    
+    Reading one character past the limit lets the detector still reject
+    over-long files while never loading more of a large file than needed.
+    The bytes are read in one bulk read and decoded in one pass; undecodable
+    bytes are replaced instead of failing the whole file.
+    
+    Args:
+        file_path (str): Path to the text file
+        max_chars (int): Maximum number of characters the detector accepts
+        
+    Returns:
+        str: The (possibly truncated) file contents
+    """
+    # UTF-8 uses at most 4 bytes per character. A buffered read keeps reading
+    # until it has that many bytes or hits EOF, so short reads on network
+    # file systems never truncate the text.
+    with open(file_path, 'rb') as file:
+        data = file.read((max_chars + 1) * 4)
+    return data.decode('utf-8', errors='replace')[:max_chars + 1]
 
 def process_file(file_path: str, detector: AIDetector) -> None:
     """
@@ -325,16 +1282,14 @@ def process_file(file_path: str, detector: AIDetector) -> None:
         detector (AIDetector): Initialized AI detector instance
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            text = file.read()
-            label, confidence = detector.detect(text)
-            print(f"\nFile: {file_path}")
-            print(f"Prediction: {label}")
-            print(f"Confidence: {confidence:.2f}")
-    except FileNotFoundError:
-        print(f"Error: File '{file_path}' not found")
-        sys.exit(1)
+        detector._validate_file(file_path)
+        text = read_text_file(file_path, detector.max_text_length)
+        label, confidence = detector.detect_document(text)
+        print(f"\nFile: {file_path}")
+        print(f"Prediction: {label}")
+        print(f"Confidence: {confidence:.2f}")
     except Exception as e:
+        # Missing files surface here too, as a SecurityError from _validate_file
         print(f"Error processing file: {str(e)}")
         sys.exit(1)
 
@@ -352,26 +1307,45 @@ def process_directory(directory: str, detector: AIDetector, output_format: str =
         if not path.is_dir():
             raise ValueError(f"'{directory}' is not a valid directory")
             
-        text_files = list(path.glob("*.txt"))
+        # Same filter as the GUI scan: symlinks are not followed, so a scan never
+        # leaves the directory, and only allowed extensions are picked up
+        with os.scandir(path) as entries:
+            text_files = [entry for entry in entries
+                          if entry.is_file(follow_symlinks=False)
+                          and entry.name.lower().endswith(detector.allowed_file_types)]
         if not text_files:
-            print(f"No .txt files found in {directory}")
+            print(f"No {', '.join(detector.allowed_file_types)} files found in {directory}")
             return
             
-        results = []
-        for file_path in text_files:
+        # Validate and read files in parallel, then classify all of them in one batched run
+        def read(entry):
             try:
-                with open(file_path, 'r', encoding='utf-8') as file:
-                    text = file.read()
-                    label, confidence = detector.detect(text)
-                    results.append({
-                        "file": str(file_path),
-                        "prediction": label,
-                        "confidence": confidence
-                    })
+                detector._validate_file(entry.path, entry.stat(follow_symlinks=False))
+                return read_text_file(entry.path, detector.max_text_length), None
             except Exception as e:
+                return None, e
+        
+        with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+            contents = list(executor.map(read, text_files))
+        
+        detections = iter(detector.batch_detect([text for text, error in contents if error is None], documents=True))
+        
+        results = []
+        for entry, (text, error) in zip(text_files, contents):
+            file_path = entry.path
+            if error is None:
+                detection = next(detections)
+                error = detection.get("error")
+            if error is not None:
                 results.append({
-                    "file": str(file_path),
-                    "error": str(e)
+                    "file": file_path,
+                    "error": str(error)
+                })
+            else:
+                results.append({
+                    "file": file_path,
+                    "prediction": detection["prediction"],
+                    "confidence": detection["confidence"]
                 })
         
         if output_format == "json":
@@ -410,6 +1384,9 @@ Examples:
   
   # Process multiple texts in batch
   python ai_detector.py --batch "text1" "text2" "text3"
+  
+  # Keep the model loaded; later --text/--file calls use this server
+  python ai_detector.py --serve
         """
     )
     
@@ -419,14 +1396,49 @@ Examples:
     group.add_argument('--dir', type=str, help='Directory containing text files to analyze')
     group.add_argument('--batch', nargs='+', help='Multiple texts to analyze')
     group.add_argument('--interactive', action='store_true', help='Run in interactive mode')
+    group.add_argument('--serve', action='store_true',
+                       help='Keep the model loaded and serve --text/--file requests from other invocations')
     
     parser.add_argument('--format', choices=['text', 'json'], default='text',
                        help='Output format (default: text)')
+    parser.add_argument('--model', type=str, default=DEFAULT_MODEL_NAME,
+                       help=f'Detector checkpoint to load (default: {DEFAULT_MODEL_NAME})')
+    parser.add_argument('--backend', choices=BACKENDS, default='torch',
+                       help='Inference backend (default: torch)')
+    parser.add_argument('--compile', action='store_true',
+                       help='Compile the model with torch.compile (slower start-up, faster inference)')
+    parser.add_argument('--no-readability', action='store_true',
+                       help='Skip the readability adjustment for faster detection')
+    parser.add_argument('--socket', type=str, default=DEFAULT_SOCKET,
+                       help=f'Address of the detector server (default: {DEFAULT_SOCKET})')
     
     args = parser.parse_args()
     
+    detector_options = {
+        "model_name": args.model,
+        "backend": args.backend,
+        "compile_model": args.compile,
+        "compute_readability": not args.no_readability
+    }
+    
     try:
-        detector = AIDetector()
+        if args.serve:
+            serve(AIDetector(**detector_options), args.socket)
+            return
+        
+        # Single requests go to a running server when possible to skip model loading
+        detector = None
+        if args.text or args.file:
+            remote = RemoteDetector(args.socket, options={
+                "model_name": args.model,
+                "backend": args.backend,
+                "compute_readability": not args.no_readability
+            })
+            if remote.is_available():
+                logger.info(f"Using detector server at {args.socket}")
+                detector = remote
+        if detector is None:
+            detector = AIDetector(**detector_options)
         
         if args.text:
             label, confidence = detector.detect(args.text)
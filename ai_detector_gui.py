@@ -1,47 +1,176 @@
 import tkinter as tk
 from tkinter import ttk, scrolledtext, filedialog, messagebox
-from ai_detector import AIDetector, SecurityError
+from ai_detector import AIDetector, SecurityError, read_text_file
 from config import Config
-from settings_dialog import SettingsDialog
-import threading
+from detection_cache import DetectionCache
 import os
+import threading
 import logging
-from datetime import datetime
-import shutil
+import logging.handlers
+import queue
+import re
+from collections import deque
+from datetime import datetime, timedelta
 from pathlib import Path
-import csv
+import hashlib
+from typing import List, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from time import monotonic
+
+# Security log file names, capturing the year, month, day, hour, minute and second
+_LOG_FILE_RE = re.compile(r'security_log_(\d{4})(\d{2})(\d{2})_(\d{2})(\d{2})(\d{2})\.log$')
+
+# Timestamp identifying this process's security log
+_SESSION_ID = datetime.now().strftime('%Y%m%d_%H%M%S')
+
+class _BufferedFileHandler(logging.FileHandler):
+    """
+    FileHandler that writes through a large buffer and only flushes on request.
+    
+    StreamHandler flushes after every record, which turns each buffered
+    batch back into one write() per record. Flushing is instead left to
+    _BatchFlushingMemoryHandler, once per batch.
+    """
+    
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=1 << 17, encoding=self.encoding, errors=self.errors)
+    
+    def flush(self):
+        pass
+    
+    def flush_batch(self):
+        super().flush()
+
+class _BatchFlushingMemoryHandler(logging.handlers.MemoryHandler):
+    """MemoryHandler that flushes its file target once after handing over each batch"""
+    
+    def flush(self):
+        super().flush()
+        with self.lock:
+            if self.target is not None:
+                self.target.flush_batch()
+
+class _TimedFlushQueueListener(logging.handlers.QueueListener):
+    """
+    QueueListener that also flushes its handlers every flush_interval seconds.
+    
+    The flush runs on the listener's own thread between records, so
+    buffered security events reach the file within about a second without
+    the Tk thread ever touching the file or the handler locks.
+    """
+    
+    def __init__(self, queue, *handlers, flush_interval: float = 1.0, respect_handler_level: bool = False):
+        super().__init__(queue, *handlers, respect_handler_level=respect_handler_level)
+        self.flush_interval = flush_interval
+        self._next_flush = monotonic() + flush_interval
+    
+    def dequeue(self, block):
+        while True:
+            timeout = self._next_flush - monotonic()
+            if timeout <= 0:
+                for handler in self.handlers:
+                    handler.flush()
+                self._next_flush = monotonic() + self.flush_interval
+                continue
+            try:
+                return self.queue.get(block, timeout)
+            except queue.Empty:
+                if not block:
+                    raise
+
+class _DedupFilter(logging.Filter):
+    """
+    Drop repeated and excessive informational security events.
+    
+    An INFO/DEBUG record identical to one seen within the last window
+    seconds is dropped, and at most rate such records pass per second.
+    WARNING and above always pass so security errors are never lost.
+    """
+    
+    def __init__(self, window: float = 5.0, rate: float = 1000.0):
+        super().__init__()
+        self.window = window
+        self.rate = rate
+        self._last_seen = {}
+        self._tokens = rate
+        self._last_refill = monotonic()
+        self._lock = threading.Lock()
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        
+        key = (record.levelno, record.msg, record.args)
+        with self._lock:
+            now = monotonic()
+            last = self._last_seen.get(key)
+            if last is not None and now - last < self.window:
+                return False
+            
+            self._tokens = min(self.rate, self._tokens + (now - self._last_refill) * self.rate)
+            self._last_refill = now
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            
+            self._last_seen[key] = now
+            if len(self._last_seen) > 4096:
+                # Forget entries that can no longer suppress anything
+                self._last_seen = {k: t for k, t in self._last_seen.items() if now - t < self.window}
+            return True
 
 class AIDetectorGUI:
     def __init__(self, root):
         self.root = root
         self.config = Config()
+        self._refresh_config_cache()
         
         # Apply UI settings
         self.root.title("AI Text Detector")
-        self.root.geometry(f"{self.config.get('ui.window_size.width')}x{self.config.get('ui.window_size.height')}")
-        self.root.minsize(
-            self.config.get('ui.min_window_size.width'),
-            self.config.get('ui.min_window_size.height')
-        )
+        self.root.geometry(f"{self._window_size[0]}x{self._window_size[1]}")
+        self.root.minsize(*self._min_window_size)
         
         # Configure security logging
-        self.log_file = f"security_log_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+        self.log_file = f"security_log_{_SESSION_ID}.log"
         self.security_logger = logging.getLogger('security')
         self.security_logger.setLevel(logging.INFO)
-        handler = logging.FileHandler(self.log_file)
-        handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
-        self.security_logger.addHandler(handler)
-        
-        # Initialize the AI detector with security parameters
-        try:
-            self.detector = AIDetector(
-                max_text_length=self.config.get('security.max_text_length'),
-                max_file_size=self.config.get('security.max_file_size')
-            )
-        except SecurityError as e:
-            messagebox.showerror("Security Error", f"Failed to initialize detector: {str(e)}")
-            self.root.destroy()
-            return
+        self.security_logger.addFilter(_DedupFilter())
+        file_handler = _BufferedFileHandler(self.log_file, mode='a', encoding='utf-8', delay=True)
+        file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+        # Records are queued by the caller and written in batches by a
+        # background thread, so logging never blocks analysis or the Tk loop
+        self._log_buffer = _BatchFlushingMemoryHandler(
+            capacity=self._log_buffer_size,
+            # Security errors are logged at WARNING and are written out at once
+            flushLevel=logging.WARNING,
+            target=file_handler,
+            flushOnClose=True
+        )
+        log_queue = queue.Queue(-1)
+        self._log_listener = _TimedFlushQueueListener(log_queue, self._log_buffer, respect_handler_level=True)
+        self._log_listener.start()
+        self.security_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+        
+        # Analyses run on a small worker pool that shares one detector; the Tk
+        # thread polls their futures, so workers never call into Tk
+        self._pool = ThreadPoolExecutor(
+            max_workers=min(self._workers, os.cpu_count() or 1),
+            thread_name_prefix='detector'
+        )
+        self.detector = None
+        # Cache namespace of the settings self.detector was built with
+        self._detector_namespace = None
+        # Analyze button per tab; a tab stays disabled while its own analysis runs
+        self.analyze_buttons = {}
+        self._busy_tabs = set()
+        self._analyze_enabled = False
+        # (filename, classification, confidence) rows of the last directory analysis
+        self._batch_records = []
+        
+        # Detection results persisted across sessions, keyed by model settings and
+        # either a text digest or a file's path, size and modification time
+        self._detect_cache = DetectionCache('.detect_cache.db')
         
         # Create menu bar
         self._create_menu_bar()
@@ -77,8 +206,11 @@ class AIDetectorGUI:
         self.security_info = ttk.Label(root, text="Security: Active", foreground="green")
         self.security_info.pack(side=tk.BOTTOM, fill=tk.X)
         
-        # Clean up old logs
-        self._cleanup_old_logs()
+        # Clean up old logs without holding up the first paint
+        self._pool.submit(self._cleanup_old_logs)
+        
+        # Load the models in the background so the window appears immediately
+        self._load_detector(self._on_initial_load)
 
     def _create_menu_bar(self):
         menubar = tk.Menu(self.root)
@@ -89,7 +221,7 @@ class AIDetectorGUI:
         menubar.add_cascade(label="File", menu=file_menu)
         file_menu.add_command(label="Settings", command=self._show_settings)
         file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self.root.quit)
+        file_menu.add_command(label="Exit", command=self._on_close)
         
         # Help menu
         help_menu = tk.Menu(menubar, tearoff=0)
@@ -97,24 +229,163 @@ class AIDetectorGUI:
         help_menu.add_command(label="About", command=self._show_about)
         help_menu.add_command(label="Documentation", command=self._show_documentation)
     
+    def _refresh_config_cache(self):
+        """Read the settings used by the GUI into attributes; called again after settings are saved"""
+        self._window_size = (self.config.get('ui.window_size.width'), self.config.get('ui.window_size.height'))
+        self._min_window_size = (self.config.get('ui.min_window_size.width'), self.config.get('ui.min_window_size.height'))
+        self._theme = self.config.get('ui.theme')
+        self._font_size = self.config.get('ui.font_size')
+        self._workers = self.config.get('ui.workers', 4)
+        self._retention_days = self.config.get('security.log_retention_days')
+        self._log_buffer_size = self.config.get('security.log_buffer', 512)
+        self._batch_size = self.config.get('analysis.batch_size')
+        self._recursive = self.config.get('analysis.recursive', False)
+        self._allowed_exts = tuple(ext.lower() for ext in self.config.get('security.allowed_file_types', ['.txt']))
+        self._detector_options = {
+            "max_text_length": self.config.get('security.max_text_length'),
+            "max_file_size": self.config.get('security.max_file_size'),
+            "model_name": self.config.get('models.roberta.model_name'),
+            "backend": self.config.get('models.backend', 'torch'),
+            "compile_model": self.config.get('models.compile', False),
+            "compute_readability": self.config.get('analysis.compute_readability', True),
+            "cache_size": self.config.get('analysis.result_cache_size', 1024),
+            "allowed_file_types": self._allowed_exts,
+            "min_text_length": self.config.get('analysis.min_text_length', 10)
+        }
+    
+    def _on_close(self):
+        """Flush buffered security logs and stop background work before exiting"""
+        self._log_listener.stop()
+        self._log_buffer.close()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self._detect_cache.close()
+        self.root.destroy()
+    
+    @staticmethod
+    def _cache_namespace(options: dict) -> str:
+        """
+        Return the part of every cache key that identifies the settings a detector was built with.
+        
+        Computed when the detector is created and kept next to it, so results
+        of a detector are never stored under the keys of newer settings. The
+        text length limit is included because it decides whether a text is
+        truncated or rejected.
+        """
+        return (f"{options['model_name']}|{options['backend']}|{options['compute_readability']}|"
+                f"{options['min_text_length']}|{options['max_text_length']}")
+    
+    @staticmethod
+    def _detect_cache_key(namespace: str, text: str) -> str:
+        """Return the persistent cache key for a text"""
+        digest = hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+        return f"{namespace}|{digest}"
+    
+    @staticmethod
+    def _file_cache_key(namespace: str, path: str, st: Optional[os.stat_result] = None) -> str:
+        """
+        Return the persistent cache key for a file's current contents.
+        
+        The key is built from the file's stat, so an unchanged file is found
+        without reading it. Pass st to reuse a stat the caller already has.
+        """
+        if st is None:
+            st = os.stat(path)
+        return f"{namespace}|file:{os.path.abspath(path)}|{st.st_size}|{st.st_mtime_ns}"
+    
+    def _cached_detect(self, detector: AIDetector, namespace: str, text: str) -> Tuple[str, float]:
+        """Return the persisted result for a text, running the detector only on a miss"""
+        key = self._detect_cache_key(namespace, text)
+        result = self._detect_cache.get(key)
+        if result is None:
+            result = detector.detect(text)
+            self._detect_cache.put(key, result)
+        return result
+    
+    def _run_task(self, task, on_done, on_poll=None):
+        """
+        Run task on the worker pool and call on_done with its future on the Tk thread.
+        
+        The future is polled from the Tk event loop, starting at 5 ms and
+        backing off to 50 ms while the task runs. on_poll, if given, is called
+        on every poll so progress can be shown without touching Tk from the worker.
+        """
+        future = self._pool.submit(task)
+        self.root.after(5, self._poll_task, future, on_done, on_poll, 5)
+    
+    def _poll_task(self, future, on_done, on_poll, interval):
+        if on_poll is not None:
+            on_poll()
+        if future.done():
+            on_done(future)
+        else:
+            interval = min(50, interval * 2)
+            self.root.after(interval, self._poll_task, future, on_done, on_poll, interval)
+    
+    def _set_analyze_enabled(self, enabled: bool):
+        """Enable or disable the analyze buttons of all tabs; busy tabs stay disabled"""
+        self._analyze_enabled = enabled
+        for tab, button in self.analyze_buttons.items():
+            button.config(state=tk.NORMAL if enabled and tab not in self._busy_tabs else tk.DISABLED)
+    
+    def _run_analysis(self, tab: str, task, on_done, on_poll=None):
+        """
+        Run an analysis for a tab, keeping the tab's analyze button disabled until it finishes.
+        
+        Repeated clicks can therefore never stack several analyses of the
+        same tab on the worker pool.
+        """
+        self._busy_tabs.add(tab)
+        self.analyze_buttons[tab].config(state=tk.DISABLED)
+        
+        def finish(future):
+            self._busy_tabs.discard(tab)
+            self._set_analyze_enabled(self._analyze_enabled)
+            on_done(future)
+        
+        self._run_task(task, finish, on_poll)
+    
+    def _load_detector(self, on_done):
+        """Create a detector from the current settings on the worker pool"""
+        self._set_analyze_enabled(False)
+        self.status_var.set("Loading models...")
+        options = self._detector_options
+        namespace = self._cache_namespace(options)
+        # The detector comes back together with the cache namespace of its own settings
+        self._run_task(lambda: (AIDetector(**options), namespace), on_done)
+    
+    def _on_initial_load(self, future):
+        try:
+            self.detector, self._detector_namespace = future.result()
+        except SecurityError as e:
+            messagebox.showerror("Security Error", f"Failed to initialize detector: {str(e)}")
+            self._on_close()
+            return
+        self._set_analyze_enabled(True)
+        self.status_var.set("Ready")
+    
     def _show_settings(self):
-        def on_save():
-            # Reinitialize detector with new settings
+        def on_load(future):
             try:
-                self.detector = AIDetector(
-                    max_text_length=self.config.get('security.max_text_length'),
-                    max_file_size=self.config.get('security.max_file_size')
-                )
-                # Update UI
-                self._update_ui_settings()
+                self.detector, self._detector_namespace = future.result()
+                self.status_var.set("Settings applied")
             except SecurityError as e:
                 messagebox.showerror("Error", f"Failed to apply settings: {str(e)}")
+                self.status_var.set("Ready")
+            self._set_analyze_enabled(self.detector is not None)
+        
+        def on_save():
+            # Reinitialize detector with new settings
+            self._refresh_config_cache()
+            self._update_ui_settings()
+            self._load_detector(on_load)
         
+        # Imported on first use so start-up does not pay for it
+        from settings_dialog import SettingsDialog
         SettingsDialog(self.root, self.config, on_save)
     
     def _update_ui_settings(self):
         # Update theme
-        theme = self.config.get('ui.theme')
+        theme = self._theme
         if theme == 'dark':
             # Apply dark theme
             self.root.tk_setPalette(background='#2b2b2b', foreground='#ffffff')
@@ -123,7 +394,7 @@ class AIDetectorGUI:
             self.root.tk_setPalette(background='#ffffff', foreground='#000000')
         
         # Update font size
-        font_size = self.config.get('ui.font_size')
+        font_size = self._font_size
         style = ttk.Style()
         style.configure('.', font=('TkDefaultFont', font_size))
     
@@ -134,8 +405,8 @@ AI Text Detector
 Version: 1.0.0
 Author: Your Name
 
-This tool helps detect AI-generated text using multiple models
-and analysis techniques. It provides a user-friendly interface
+This tool helps detect AI-generated text using a transformer
+classifier and text analysis techniques. It provides a user-friendly interface
 for analyzing text, files, and directories.
 
 Security features:
@@ -177,23 +448,27 @@ For more information, visit the project repository.
     
     def _cleanup_old_logs(self):
         log_dir = Path(".")
-        retention_days = self.config.get('security.log_retention_days')
-        current_time = datetime.now()
+        # Logs older than retention_days full days are removed
+        cutoff = datetime.now() - timedelta(days=self._retention_days + 1)
         
-        for log_file in log_dir.glob("security_log_*.log"):
+        for log_file in log_dir.iterdir():
+            match = _LOG_FILE_RE.match(log_file.name)
+            if match is None:
+                continue
             try:
                 # Extract date from filename
-                date_str = log_file.stem.split('_')[2:4]  # Get date and time parts
-                if len(date_str) == 2:
-                    file_date = datetime.strptime('_'.join(date_str), '%Y%m%d_%H%M%S')
-                    if (current_time - file_date).days > retention_days:
-                        log_file.unlink()
+                file_date = datetime(*map(int, match.groups()))
+                if file_date <= cutoff:
+                    log_file.unlink()
             except Exception as e:
                 self._log_security_event("Log Cleanup Error", str(e))
 
     def _log_security_event(self, event_type: str, details: str):
         """Log security-related events"""
-        self.security_logger.info(f"{event_type}: {details}")
+        # Errors are logged as warnings so the dedup filter never drops them
+        level = logging.WARNING if event_type.endswith("Error") else logging.INFO
+        # Lazy %-formatting: the message is only built if a handler emits it
+        self.security_logger.log(level, "%s: %s", event_type, details)
 
     def _create_text_tab(self):
         # Text input area
@@ -206,7 +481,9 @@ For more information, visit the project repository.
         button_frame.pack(fill=tk.X, pady=5)
         
         # Analyze button
-        ttk.Button(button_frame, text="Analyze Text", command=self._analyze_text).pack(side=tk.LEFT, padx=5)
+        analyze_button = ttk.Button(button_frame, text="Analyze Text", command=self._analyze_text)
+        analyze_button.pack(side=tk.LEFT, padx=5)
+        self.analyze_buttons['text'] = analyze_button
         
         # Clear button
         ttk.Button(button_frame, text="Clear", command=lambda: self._clear_results('text')).pack(side=tk.LEFT, padx=5)
@@ -229,7 +506,9 @@ For more information, visit the project repository.
         button_frame.pack(fill=tk.X, pady=5)
         
         # Analyze button
-        ttk.Button(button_frame, text="Analyze File", command=self._analyze_file).pack(side=tk.LEFT, padx=5)
+        analyze_button = ttk.Button(button_frame, text="Analyze File", command=self._analyze_file)
+        analyze_button.pack(side=tk.LEFT, padx=5)
+        self.analyze_buttons['file'] = analyze_button
         
         # Clear button
         ttk.Button(button_frame, text="Clear", command=lambda: self._clear_results('file')).pack(side=tk.LEFT, padx=5)
@@ -257,7 +536,9 @@ For more information, visit the project repository.
         button_frame.pack(fill=tk.X, pady=5)
         
         # Analyze button
-        ttk.Button(button_frame, text="Analyze Directory", command=self._analyze_directory).pack(side=tk.LEFT, padx=5)
+        analyze_button = ttk.Button(button_frame, text="Analyze Directory", command=self._analyze_directory)
+        analyze_button.pack(side=tk.LEFT, padx=5)
+        self.analyze_buttons['batch'] = analyze_button
         
         # Copy Results button
         self.copy_batch_button = ttk.Button(button_frame, text="Copy Results", command=self._copy_batch_results, state=tk.DISABLED)
@@ -286,6 +567,8 @@ For more information, visit the project repository.
 
     def _export_to_csv(self):
         """Export batch analysis results to a CSV file"""
+        import csv
+        
         try:
             # Get the save file path
             file_path = filedialog.asksaveasfilename(
@@ -297,27 +580,12 @@ For more information, visit the project repository.
             if not file_path:  # User cancelled
                 return
                 
-            # Get the results from the text widget
-            results = self.batch_result.get("1.0", tk.END).strip().split('\n')
-            
-            # Parse results and write to CSV
+            # Write the structured results of the last analysis; files that
+            # failed have no classification and are not exported
             with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
                 writer = csv.writer(csvfile)
                 writer.writerow(['Filename', 'Classification', 'Confidence'])  # Header
-                
-                for result in results:
-                    if not result.strip():  # Skip empty lines
-                        continue
-                    try:
-                        # Parse the result line
-                        filename = result.split(':')[0]
-                        classification = result.split(':')[1].split('(')[0].strip()
-                        confidence = result.split('(')[1].split(')')[0].strip()
-                        
-                        writer.writerow([filename, classification, confidence])
-                    except Exception as e:
-                        self._log_security_event("CSV Export Error", f"Failed to parse line: {result}")
-                        continue
+                writer.writerows(self._batch_records)
             
             self.status_var.set(f"Results exported to {os.path.basename(file_path)}")
             self._log_security_event("CSV Export", f"Successfully exported results to {file_path}")
@@ -329,21 +597,37 @@ For more information, visit the project repository.
             self.status_var.set("Export failed")
 
     def _analyze_text(self):
-        text = self.text_input.get("1.0", tk.END).strip()
+        # Check for input before copying the buffer; "end-1c" drops the newline Tk always appends
+        text = self.text_input.get("1.0", "end-1c").strip() if self.text_input.count("1.0", "end-1c", "chars") else ""
         if not text:
             messagebox.showwarning("Warning", "Please enter some text to analyze")
             return
         
+        def show(label, confidence):
+            self.text_result.config(text=f"Result: {label} (Confidence: {confidence:.2%})")
+            self.status_var.set("Analysis complete")
+            self._log_security_event("Text Analysis", f"Completed: {label} ({confidence:.2%})")
+        
+        # A cache hit is a single indexed lookup, cheaper than a round trip
+        # through the worker pool and the poll loop
+        namespace = self._detector_namespace
+        cached = self._detect_cache.get(self._detect_cache_key(namespace, text))
+        if cached is not None:
+            show(*cached)
+            return
+        
         self.status_var.set("Analyzing...")
         self.text_result.config(text="Analyzing...")
         
+        detector = self.detector
+        
         def analyze():
+            self._log_security_event("Text Analysis", "Starting text analysis")
+            return self._cached_detect(detector, namespace, text)
+        
+        def done(future):
             try:
-                self._log_security_event("Text Analysis", "Starting text analysis")
-                label, confidence = self.detector.detect(text)
-                self.text_result.config(text=f"Result: {label} (Confidence: {confidence:.2%})")
-                self.status_var.set("Analysis complete")
-                self._log_security_event("Text Analysis", f"Completed: {label} ({confidence:.2%})")
+                show(*future.result())
             except SecurityError as e:
                 self._log_security_event("Security Error", str(e))
                 self.text_result.config(text=f"Security Error: {str(e)}")
@@ -354,7 +638,7 @@ For more information, visit the project repository.
                 self.text_result.config(text=f"Error: {str(e)}")
                 self.status_var.set("Error occurred")
         
-        threading.Thread(target=analyze).start()
+        self._run_analysis('text', analyze, done)
 
     def _select_file(self):
         try:
@@ -377,12 +661,22 @@ For more information, visit the project repository.
         self.status_var.set("Analyzing file...")
         self.file_result.config(text="Analyzing...")
         
+        detector = self.detector
+        namespace = self._detector_namespace
+        
         def analyze():
+            self._log_security_event("File Analysis", f"Starting analysis of {file_path}")
+            detector._validate_file(file_path)
+            file_key = self._file_cache_key(namespace, file_path)
+            result = self._detect_cache.get(file_key)
+            if result is None:
+                result = self._cached_detect(detector, namespace, read_text_file(file_path, detector.max_text_length))
+                self._detect_cache.put(file_key, result)
+            return result
+        
+        def done(future):
             try:
-                self._log_security_event("File Analysis", f"Starting analysis of {file_path}")
-                with open(file_path, 'r', encoding='utf-8') as file:
-                    text = file.read()
-                label, confidence = self.detector.detect(text)
+                label, confidence = future.result()
                 self.file_result.config(text=f"Result: {label} (Confidence: {confidence:.2%})")
                 self.status_var.set("Analysis complete")
                 self._log_security_event("File Analysis", f"Completed: {label} ({confidence:.2%})")
@@ -396,7 +690,7 @@ For more information, visit the project repository.
                 self.file_result.config(text=f"Error: {str(e)}")
                 self.status_var.set("Error occurred")
         
-        threading.Thread(target=analyze).start()
+        self._run_analysis('file', analyze, done)
 
     def _select_directory(self):
         try:
@@ -419,62 +713,195 @@ For more information, visit the project repository.
         self.batch_result.insert(tk.END, "Analyzing...\n")
         self.copy_batch_button.config(state=tk.DISABLED)  # Disable copy button while analyzing
         self.export_button.config(state=tk.DISABLED)  # Disable export button while analyzing
+        self._batch_records = []
+        
+        detector = self.detector
+        namespace = self._detector_namespace
+        batch_size = self._batch_size
+        recursive = self._recursive
+        progress = [0.0]  # Written by the worker, shown by the Tk thread
+        # Finished result lines in file order, appended by the worker and moved
+        # into the widget by the Tk thread; started[0] is set once the
+        # "Analyzing..." placeholder has been replaced
+        ready = deque()
+        started = [False]
         
         def analyze():
+            self._log_security_event("Batch Analysis", f"Starting analysis of directory: {dir_path}")
+            text_files = self._list_text_files(dir_path, recursive)
+            total_files = len(text_files)
+            
+            def load(entry, name):
+                path = entry.path
+                try:
+                    # One lstat per file serves validation, the empty check and the
+                    # cache key; symlinks were already excluded by the scan
+                    st = entry.stat(follow_symlinks=False)
+                    # Oversize files are rejected by _validate_file and empty ones
+                    # never need to be opened
+                    if detector._validate_file(path, st) == 0:
+                        return name, "", None, None, None
+                    # Files unchanged since an earlier run are neither read nor analyzed
+                    file_key = self._file_cache_key(namespace, path, st)
+                    cached = self._detect_cache.get(file_key)
+                    if cached is not None:
+                        return name, None, None, cached, None
+                    return name, read_text_file(path, detector.max_text_length), file_key, None, None
+                except Exception as e:
+                    return name, None, None, None, e
+            
+            # Upcoming files are loaded by a few reader threads while the current
+            # batch is analyzed, so slow storage overlaps both with inference and
+            # with itself. At most read_ahead files are held in memory at a time.
+            read_workers = min(8, (os.cpu_count() or 1) * 2)
+            read_ahead = read_workers * 2
+            readers = ThreadPoolExecutor(max_workers=read_workers, thread_name_prefix='reader')
+            loading = deque(readers.submit(load, *entry) for entry in text_files[:read_ahead])
+            
+            # Files are classified in batches of batch_size with one padded forward pass each
+            results = [None] * total_files
+            records = [None] * total_files
+            pending = []
+            published = 0
+            
+            def record_error(idx, filename, message, security):
+                if security:
+                    self._log_security_event("Security Error", f"{filename}: {message}")
+                    results[idx] = f"{filename}: Security Error - {message}\n"
+                else:
+                    self._log_security_event("Error", f"{filename}: {message}")
+                    results[idx] = f"{filename}: Error - {message}\n"
+            
+            def record_success(idx, filename, label, confidence):
+                results[idx] = f"{filename}: {label} (Confidence: {confidence:.2%})\n"
+                records[idx] = (filename, label, f"{confidence:.2%}")
+                self._log_security_event("File Analysis", f"Completed {filename}: {label} ({confidence:.2%})")
+            
             try:
-                self._log_security_event("Batch Analysis", f"Starting analysis of directory: {dir_path}")
-                # Get list of text files
-                text_files = [f for f in os.listdir(dir_path) if f.endswith('.txt')]
-                total_files = len(text_files)
-                
-                if total_files == 0:
-                    self.batch_result.delete("1.0", tk.END)
-                    self.batch_result.insert(tk.END, "No text files found in the selected directory.")
-                    self.status_var.set("No text files found")
-                    return
-                
-                results = []
-                # Reset progress
-                self.progress_var.set(0)
-                
-                for i, filename in enumerate(text_files, 1):
-                    file_path = os.path.join(dir_path, filename)
-                    try:
-                        with open(file_path, 'r', encoding='utf-8') as file:
-                            text = file.read()
-                        label, confidence = self.detector.detect(text)
-                        results.append(f"{filename}: {label} (Confidence: {confidence:.2%})\n")
-                        self._log_security_event("File Analysis", f"Completed {filename}: {label} ({confidence:.2%})")
-                    except SecurityError as e:
-                        self._log_security_event("Security Error", f"{filename}: {str(e)}")
-                        results.append(f"{filename}: Security Error - {str(e)}\n")
-                    except Exception as e:
-                        self._log_security_event("Error", f"{filename}: {str(e)}")
-                        results.append(f"{filename}: Error - {str(e)}\n")
+                for i in range(total_files):
+                    filename, text, file_key, cached, error = loading.popleft().result()
+                    if i + read_ahead < total_files:
+                        loading.append(readers.submit(load, *text_files[i + read_ahead]))
+                    if error is not None:
+                        record_error(i, filename, str(error), isinstance(error, SecurityError))
+                    elif cached is not None:
+                        record_success(i, filename, *cached)
+                    elif not text:
+                        results[i] = f"{filename}: Skipped - empty file\n"
+                    else:
+                        key = self._detect_cache_key(namespace, text)
+                        cached = self._detect_cache.get(key)
+                        if cached is not None:
+                            # Same contents as a text seen before, e.g. a copied or touched file
+                            self._detect_cache.put(file_key, cached)
+                            record_success(i, filename, *cached)
+                        else:
+                            pending.append((i, filename, text, key, file_key))
+                    
+                    if pending and (len(pending) == batch_size or i == total_files - 1):
+                        detections = detector.batch_detect([text for _, _, text, _, _ in pending], batch_size=batch_size)
+                        stored = []
+                        for (idx, filename, _, key, file_key), detection in zip(pending, detections):
+                            if detection["status"] == "error":
+                                record_error(idx, filename, detection["error"], detection["security"])
+                                continue
+                            result = (detection["prediction"], detection["confidence"])
+                            stored += [(key, result), (file_key, result)]
+                            record_success(idx, filename, *result)
+                        # One transaction per batch
+                        self._detect_cache.put_many(stored)
+                        pending = []
                     
                     # Update progress
-                    progress = (i / total_files) * 100
-                    self.progress_var.set(progress)
-                    self.root.update_idletasks()
-                
+                    progress[0] = ((i + 1) / total_files) * 100
+                    
+                    # With no batch pending every file so far has a result to show
+                    if not pending:
+                        ready.append(''.join(results[published:i + 1]))
+                        published = i + 1
+            finally:
+                # Cancels outstanding reads if the loop raised
+                readers.shutdown(wait=False, cancel_futures=True)
+            
+            return results, [record for record in records if record is not None]
+        
+        def show_progress():
+            self.progress_var.set(progress[0])
+            if not ready:
+                return
+            chunks = []
+            while ready:
+                chunks.append(ready.popleft())
+            if not started[0]:
                 self.batch_result.delete("1.0", tk.END)
-                for result in results:
-                    self.batch_result.insert(tk.END, result)
-                self.status_var.set(f"Analysis complete. Processed {total_files} files.")
-                self._log_security_event("Batch Analysis", "Completed directory analysis")
-                self.copy_batch_button.config(state=tk.NORMAL)  # Enable copy button after analysis
-                self.export_button.config(state=tk.NORMAL)  # Enable export button after analysis
+                started[0] = True
+            # One insert per poll however many files finished since the last one
+            self.batch_result.insert(tk.END, ''.join(chunks))
+        
+        def done(future):
+            # Reset progress bar
+            self.progress_var.set(0)
+            try:
+                results, self._batch_records = future.result()
             except Exception as e:
                 self._log_security_event("Error", str(e))
                 self.batch_result.delete("1.0", tk.END)
                 self.batch_result.insert(tk.END, f"Error: {str(e)}")
                 self.status_var.set("Error occurred")
-            finally:
-                # Reset progress bar
-                self.progress_var.set(0)
-
-        threading.Thread(target=analyze).start()
+                return
+            
+            if not results:
+                self.batch_result.delete("1.0", tk.END)
+                self.batch_result.insert(tk.END, "No text files found in the selected directory.")
+                self.status_var.set("No text files found")
+                return
+            
+            # Lines finished after the last poll
+            show_progress()
+            self.progress_var.set(0)
+            self.status_var.set(f"Analysis complete. Processed {len(results)} files.")
+            self._log_security_event("Batch Analysis", "Completed directory analysis")
+            self.copy_batch_button.config(state=tk.NORMAL)  # Enable copy button after analysis
+            self.export_button.config(state=tk.NORMAL)  # Enable export button after analysis
+        
+        # Reset progress
+        self.progress_var.set(0)
+        self._run_analysis('batch', analyze, done, on_poll=show_progress)
 
+    def _list_text_files(self, dir_path: str, recursive: bool = False) -> List[Tuple[os.DirEntry, str]]:
+        """
+        List the files with an allowed extension in a directory.
+        
+        Symbolic links are not followed, so a scan never leaves the selected
+        directory. Unreadable subdirectories are skipped.
+        
+        Args:
+            dir_path (str): Directory selected by the user
+            recursive (bool): Also include files in subdirectories, skipping
+                hidden ones
+            
+        Returns:
+            List[Tuple[os.DirEntry, str]]: (entry, display name) pairs; the
+                display name is relative to dir_path
+        """
+        allowed = self._allowed_exts
+        text_files = []
+        directories = [dir_path]
+        while directories:
+            current = directories.pop()
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.is_file(follow_symlinks=False):
+                            if entry.name.lower().endswith(allowed):
+                                text_files.append((entry, os.path.relpath(entry.path, dir_path)))
+                        elif recursive and not entry.name.startswith('.') and entry.is_dir(follow_symlinks=False):
+                            directories.append(entry.path)
+            except OSError:
+                if current == dir_path:
+                    raise
+        return text_files
+    
     def _clear_results(self, tab_type):
         """Clear results and reset interface for the specified tab"""
         if tab_type == 'text':
@@ -488,6 +915,7 @@ For more information, visit the project repository.
         elif tab_type == 'batch':
             self.dir_path_var.set("")
             self.batch_result.delete("1.0", tk.END)
+            self._batch_records = []
             self.progress_var.set(0)
             self.copy_batch_button.config(state=tk.DISABLED)
             self.export_button.config(state=tk.DISABLED)
@@ -496,6 +924,10 @@ For more information, visit the project repository.
         self._log_security_event("Clear Results", f"Cleared {tab_type} tab results")
 
 def main():
+    # No log format uses thread or process details, so skip gathering them for every record
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
     root = tk.Tk()
     app = AIDetectorGUI(root)
     root.mainloop()
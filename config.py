@@ -1,50 +1,60 @@
+import copy
 import json
 import os
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Dict, Any
 
+# Defaults for every setting. Shared by all Config instances and never modified;
+# _load_config builds each instance's own copy.
+DEFAULT_CONFIG = {
+    "security": {
+        "max_text_length": 10000,
+        "max_file_size": 1024 * 1024,
+        "rate_limit": 100,
+        "allowed_file_types": [".txt"],
+        "log_retention_days": 30,
+        "log_buffer": 512
+    },
+    "models": {
+        "backend": "torch",
+        "compile": False,
+        "roberta": {
+            "model_name": "roberta-base-openai-detector",
+            "max_length": 512,
+            "truncation": True
+        }
+    },
+    "ui": {
+        "theme": "light",
+        "font_size": 12,
+        "workers": 4,
+        "window_size": {
+            "width": 800,
+            "height": 600
+        },
+        "min_window_size": {
+            "width": 600,
+            "height": 400
+        }
+    },
+    "analysis": {
+        "confidence_threshold": 0.7,
+        "min_text_length": 10,
+        "batch_size": 10,
+        "compute_readability": True,
+        "recursive": False,
+        "result_cache_size": 1024
+    }
+}
+
 class Config:
     def __init__(self, config_path: str = "config.json"):
         self.config_path = config_path
-        self.default_config = {
-            "security": {
-                "max_text_length": 10000,
-                "max_file_size": 1024 * 1024,
-                "rate_limit": 100,
-                "allowed_file_types": [".txt"],
-                "log_retention_days": 30
-            },
-            "models": {
-                "gpt2": {
-                    "model_name": "microsoft/DialogRPT-human-vs-rand",
-                    "max_length": 512,
-                    "truncation": True
-                },
-                "roberta": {
-                    "model_name": "roberta-base-openai-detector",
-                    "max_length": 512,
-                    "truncation": True
-                }
-            },
-            "ui": {
-                "theme": "light",
-                "font_size": 12,
-                "window_size": {
-                    "width": 800,
-                    "height": 600
-                },
-                "min_window_size": {
-                    "width": 600,
-                    "height": 400
-                }
-            },
-            "analysis": {
-                "confidence_threshold": 0.7,
-                "min_text_length": 10,
-                "batch_size": 10
-            }
-        }
+        self.default_config = DEFAULT_CONFIG
         self.config = self._load_config()
+        # Set while inside batched(); set() then leaves saving to the end of the block
+        self._defer_save = False
 
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from file or create default if not exists"""
@@ -53,20 +63,60 @@ class Config:
                 with open(self.config_path, 'r') as f:
                     config = json.load(f)
                     # Merge with default config to ensure all settings exist
-                    return {**self.default_config, **config}
-            return self.default_config
+                    return self._deep_merge(self.default_config, config)
+            return self._deep_merge(self.default_config, {})
         except Exception as e:
             print(f"Error loading config: {e}")
-            return self.default_config
+            return self._deep_merge(self.default_config, {})
+
+    @staticmethod
+    def _deep_merge(default: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Merge override into a copy of default, recursing into nested sections.
+        
+        A file that sets only some keys of a section keeps the defaults for
+        the rest. The result shares no mutable values with default, so
+        neither set() nor in-place edits of lists can modify the defaults.
+        """
+        merged = {}
+        for key, value in default.items():
+            if key not in override:
+                merged[key] = Config._deep_merge(value, {}) if isinstance(value, dict) else copy.deepcopy(value)
+            elif isinstance(value, dict) and isinstance(override[key], dict):
+                merged[key] = Config._deep_merge(value, override[key])
+            else:
+                merged[key] = override[key]
+        for key, value in override.items():
+            if key not in default:
+                merged[key] = value
+        return merged
+
+    def reset_to_defaults(self) -> None:
+        """Replace the configuration with a fresh copy of the defaults and save it"""
+        self.config = self._deep_merge(self.default_config, {})
+        self.save_config()
 
     def save_config(self) -> None:
         """Save current configuration to file"""
         try:
-            with open(self.config_path, 'w') as f:
+            # Write a temporary file and swap it in, so a crash never leaves a truncated config
+            tmp_path = f"{self.config_path}.tmp"
+            with open(tmp_path, 'w') as f:
                 json.dump(self.config, f, indent=4)
+            os.replace(tmp_path, self.config_path)
         except Exception as e:
             print(f"Error saving config: {e}")
 
+    @contextmanager
+    def batched(self):
+        """Defer saving while several values are set; the file is written once if the block succeeds"""
+        self._defer_save = True
+        try:
+            yield self
+        finally:
+            self._defer_save = False
+        self.save_config()
+
     def get(self, key: str, default: Any = None) -> Any:
         """Get configuration value by key"""
         keys = key.split('.')
@@ -87,7 +137,8 @@ class Config:
                 config[k] = {}
             config = config[k]
         config[keys[-1]] = value
-        self.save_config()
+        if not self._defer_save:
+            self.save_config()
 
     def validate_config(self) -> bool:
         """Validate configuration values"""
@@ -98,10 +149,13 @@ class Config:
             assert security['max_file_size'] > 0
             assert security['rate_limit'] > 0
             assert isinstance(security['allowed_file_types'], list)
+            assert security.get('log_buffer', 512) > 0
             
             # Validate model settings
             models = self.config['models']
-            for model in models.values():
+            assert models.get('backend', 'torch') in ['torch', 'torch-int8', 'onnx', 'onnx-int8']
+            assert isinstance(models.get('compile', False), bool)
+            for model in (m for m in models.values() if isinstance(m, dict)):
                 assert isinstance(model['model_name'], str)
                 assert model['max_length'] > 0
                 assert isinstance(model['truncation'], bool)
@@ -110,6 +164,7 @@ class Config:
             ui = self.config['ui']
             assert ui['theme'] in ['light', 'dark']
             assert ui['font_size'] > 0
+            assert ui.get('workers', 4) > 0
             assert ui['window_size']['width'] > 0
             assert ui['window_size']['height'] > 0
             
@@ -118,6 +173,9 @@ class Config:
             assert 0 <= analysis['confidence_threshold'] <= 1
             assert analysis['min_text_length'] > 0
             assert analysis['batch_size'] > 0
+            assert isinstance(analysis.get('compute_readability', True), bool)
+            assert isinstance(analysis.get('recursive', False), bool)
+            assert analysis.get('result_cache_size', 1024) >= 0
             
             return True
         except (AssertionError, KeyError) as e:
@@ -0,0 +1,79 @@
+import sqlite3
+import threading
+from typing import Iterable, Optional, Tuple
+
+class DetectionCache:
+    """
+    Persistent store of detection results backed by a single SQLite file.
+
+    Keys are opaque strings built by the caller, either from a digest of
+    the analyzed text or from a file's path, size and modification time.
+    The model settings are included in the key, so switching models
+    never returns stale results.
+    """
+
+    def __init__(self, path: str = ".detect_cache.db"):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path (str): Location of the SQLite database file
+        """
+        # The connection is shared by the worker pool; the lock serializes access
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock:
+            # WAL with synchronous=NORMAL keeps commits cheap; a crash can at
+            # most lose the last few results, which are recomputed on demand
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache("
+                "key TEXT PRIMARY KEY, label TEXT NOT NULL, confidence REAL NOT NULL)"
+            )
+            self._conn.commit()
+
+    def get(self, key: Optional[str]) -> Optional[Tuple[str, float]]:
+        """
+        Look up a stored result.
+
+        Args:
+            key (Optional[str]): Cache key; None always misses
+
+        Returns:
+            Optional[Tuple[str, float]]: (label, confidence), or None on a miss
+        """
+        if key is None:
+            return None
+        with self._lock:
+            row = self._conn.execute("SELECT label, confidence FROM cache WHERE key = ?", (key,)).fetchone()
+        return tuple(row) if row is not None else None
+
+    def put(self, key: Optional[str], result: Tuple[str, float]) -> None:
+        """
+        Store a single result; a None key is ignored.
+
+        Args:
+            key (Optional[str]): Cache key
+            result (Tuple[str, float]): (label, confidence)
+        """
+        self.put_many([(key, result)])
+
+    def put_many(self, items: Iterable[Tuple[Optional[str], Tuple[str, float]]]) -> None:
+        """
+        Store several results in one transaction; entries with a None key are skipped.
+
+        Args:
+            items (Iterable[Tuple[Optional[str], Tuple[str, float]]]): (key, (label, confidence)) pairs
+        """
+        rows = [(key, label, confidence) for key, (label, confidence) in items if key is not None]
+        if not rows:
+            return
+        with self._lock:
+            self._conn.executemany("INSERT OR REPLACE INTO cache(key, label, confidence) VALUES (?, ?, ?)", rows)
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
@@ -75,23 +75,23 @@ class SettingsDialog(tk.Toplevel):
         frame = ttk.LabelFrame(self.models_tab, text="Model Settings", padding=10)
         frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
         
-        # GPT2 Model
-        ttk.Label(frame, text="GPT2 Model:").grid(row=0, column=0, sticky=tk.W, pady=5)
-        self.gpt2_model = ttk.Entry(frame)
-        self.gpt2_model.insert(0, self.config.get("models.gpt2.model_name"))
-        self.gpt2_model.grid(row=0, column=1, sticky=tk.EW, pady=5)
-        
         # Roberta Model
-        ttk.Label(frame, text="Roberta Model:").grid(row=1, column=0, sticky=tk.W, pady=5)
+        ttk.Label(frame, text="Roberta Model:").grid(row=0, column=0, sticky=tk.W, pady=5)
         self.roberta_model = ttk.Entry(frame)
         self.roberta_model.insert(0, self.config.get("models.roberta.model_name"))
-        self.roberta_model.grid(row=1, column=1, sticky=tk.EW, pady=5)
+        self.roberta_model.grid(row=0, column=1, sticky=tk.EW, pady=5)
         
         # Max length
-        ttk.Label(frame, text="Maximum Input Length:").grid(row=2, column=0, sticky=tk.W, pady=5)
+        ttk.Label(frame, text="Maximum Input Length:").grid(row=1, column=0, sticky=tk.W, pady=5)
         self.max_length = ttk.Entry(frame)
-        self.max_length.insert(0, str(self.config.get("models.gpt2.max_length")))
-        self.max_length.grid(row=2, column=1, sticky=tk.EW, pady=5)
+        self.max_length.insert(0, str(self.config.get("models.roberta.max_length")))
+        self.max_length.grid(row=1, column=1, sticky=tk.EW, pady=5)
+        
+        # Inference backend; onnx and onnx-int8 need the optional optimum[onnxruntime] package
+        ttk.Label(frame, text="Inference Backend:").grid(row=2, column=0, sticky=tk.W, pady=5)
+        self.backend = ttk.Combobox(frame, values=["torch", "torch-int8", "onnx", "onnx-int8"], state="readonly")
+        self.backend.set(self.config.get("models.backend", "torch"))
+        self.backend.grid(row=2, column=1, sticky=tk.EW, pady=5)
         
         frame.columnconfigure(1, weight=1)
     
@@ -139,26 +139,27 @@ class SettingsDialog(tk.Toplevel):
     
     def _save_settings(self):
         try:
-            # Security settings
-            self.config.set("security.max_text_length", int(self.max_text_length.get()))
-            self.config.set("security.max_file_size", int(self.max_file_size.get()) * 1024 * 1024)
-            self.config.set("security.rate_limit", int(self.rate_limit.get()))
-            self.config.set("security.log_retention_days", int(self.log_retention.get()))
-            
-            # Model settings
-            self.config.set("models.gpt2.model_name", self.gpt2_model.get())
-            self.config.set("models.roberta.model_name", self.roberta_model.get())
-            self.config.set("models.gpt2.max_length", int(self.max_length.get()))
-            self.config.set("models.roberta.max_length", int(self.max_length.get()))
-            
-            # UI settings
-            self.config.set("ui.theme", self.theme.get())
-            self.config.set("ui.font_size", int(self.font_size.get()))
-            
-            # Analysis settings
-            self.config.set("analysis.confidence_threshold", float(self.confidence_threshold.get()))
-            self.config.set("analysis.min_text_length", int(self.min_text_length.get()))
-            self.config.set("analysis.batch_size", int(self.batch_size.get()))
+            # One write of config.json for the whole dialog
+            with self.config.batched():
+                # Security settings
+                self.config.set("security.max_text_length", int(self.max_text_length.get()))
+                self.config.set("security.max_file_size", int(self.max_file_size.get()) * 1024 * 1024)
+                self.config.set("security.rate_limit", int(self.rate_limit.get()))
+                self.config.set("security.log_retention_days", int(self.log_retention.get()))
+                
+                # Model settings
+                self.config.set("models.roberta.model_name", self.roberta_model.get())
+                self.config.set("models.roberta.max_length", int(self.max_length.get()))
+                self.config.set("models.backend", self.backend.get())
+                
+                # UI settings
+                self.config.set("ui.theme", self.theme.get())
+                self.config.set("ui.font_size", int(self.font_size.get()))
+                
+                # Analysis settings
+                self.config.set("analysis.confidence_threshold", float(self.confidence_threshold.get()))
+                self.config.set("analysis.min_text_length", int(self.min_text_length.get()))
+                self.config.set("analysis.batch_size", int(self.batch_size.get()))
             
             if self.config.validate_config():
                 self.on_save()
@@ -170,7 +171,6 @@ class SettingsDialog(tk.Toplevel):
     
     def _reset_defaults(self):
         if messagebox.askyesno("Reset to Defaults", "Are you sure you want to reset all settings to defaults?"):
-            self.config.config = self.config.default_config
-            self.config.save_config()
+            self.config.reset_to_defaults()
             self.on_save()
             self.destroy() 
\ No newline at end of file
@@ -0,0 +1,20 @@
+from config import Config, DEFAULT_CONFIG
+
+
+def test_configs_do_not_share_default_lists(tmp_path):
+    first = Config(str(tmp_path / "first.json"))
+    second = Config(str(tmp_path / "second.json"))
+
+    first.get("security.allowed_file_types").append(".md")
+
+    assert second.get("security.allowed_file_types") == [".txt"]
+    assert DEFAULT_CONFIG["security"]["allowed_file_types"] == [".txt"]
+
+
+def test_reset_to_defaults_copies_lists(tmp_path):
+    config = Config(str(tmp_path / "config.json"))
+    config.reset_to_defaults()
+
+    config.get("security.allowed_file_types").append(".md")
+
+    assert DEFAULT_CONFIG["security"]["allowed_file_types"] == [".txt"]
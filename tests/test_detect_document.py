@@ -0,0 +1,92 @@
+import pytest
+
+torch = pytest.importorskip("torch")
+pytest.importorskip("transformers")
+
+import ai_detector
+from ai_detector import AIDetector, MAX_INPUT_TOKENS
+
+
+class _WordTokenizer:
+    """Tokenizer stand-in that maps every whitespace-separated word to one token"""
+
+    def __init__(self):
+        self.vocab = {}
+        self.words = {}
+
+    def _encode(self, text):
+        ids = []
+        for word in text.split():
+            if word not in self.vocab:
+                self.vocab[word] = len(self.vocab) + 2
+                self.words[self.vocab[word]] = word
+            ids.append(self.vocab[word])
+        return ids
+
+    def num_special_tokens_to_add(self):
+        return 2
+
+    def decode(self, ids):
+        return " ".join(self.words[i] for i in ids)
+
+    def __call__(self, texts, truncation=False, max_length=None, return_length=False,
+                 add_special_tokens=True, return_tensors=None):
+        single = isinstance(texts, str)
+        input_ids = []
+        for text in [texts] if single else texts:
+            ids = self._encode(text)
+            if add_special_tokens:
+                ids = [0] + ids + [1]
+            if truncation and max_length is not None:
+                ids = ids[:max_length]
+            input_ids.append(ids)
+        encodings = {"input_ids": input_ids, "attention_mask": [[1] * len(ids) for ids in input_ids]}
+        if return_length:
+            encodings["length"] = [len(ids) for ids in input_ids]
+        if return_tensors == "pt":
+            return self.pad(encodings, return_tensors="pt")
+        if single:
+            return {key: value[0] for key, value in encodings.items()}
+        return encodings
+
+    def pad(self, encodings, return_tensors=None):
+        longest = max(len(ids) for ids in encodings["input_ids"])
+        return {
+            key: torch.tensor([row + [0] * (longest - len(row)) for row in rows])
+            for key, rows in encodings.items()
+        }
+
+
+class _ConstantModel:
+    """Model stand-in that classifies every input as LABEL_1 and records batch sizes"""
+
+    class config:
+        id2label = {0: "LABEL_0", 1: "LABEL_1"}
+
+    def __init__(self):
+        self.rows = 0
+
+    def __call__(self, input_ids, attention_mask):
+        self.rows += input_ids.shape[0]
+        logits = torch.tensor([[0.0, 2.0]]).repeat(input_ids.shape[0], 1)
+        return type("Output", (), {"logits": logits})()
+
+
+@pytest.fixture
+def detector(monkeypatch):
+    model = _ConstantModel()
+    classifier = ai_detector._Classifier(model, _WordTokenizer())
+    monkeypatch.setattr(AIDetector, "_load_classifier", lambda self, model_name: classifier)
+    return AIDetector(compute_readability=False, cache_size=0), model
+
+
+def test_detect_document_over_several_windows(detector):
+    detector, model = detector
+    # Twice the model's input length in distinct words needs more than one window
+    text = " ".join(f"w{i}" for i in range(2 * MAX_INPUT_TOKENS))
+
+    label, confidence = detector.detect_document(text)
+
+    assert label == "AI"
+    assert 0.5 < confidence <= 1.0
+    assert model.rows > 1
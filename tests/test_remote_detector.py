@@ -0,0 +1,47 @@
+import pytest
+
+pytest.importorskip("torch")
+pytest.importorskip("transformers")
+
+import ai_detector
+from ai_detector import RemoteDetector, process_file
+
+
+class _UnreachableDetector(RemoteDetector):
+    """RemoteDetector that fails the test if it ever contacts a server"""
+
+    def _send(self, request):
+        raise AssertionError("the file should have been rejected before any request")
+
+
+@pytest.mark.parametrize("name, content", [
+    ("large.txt", "x" * 64),
+    ("notes.md", "short"),
+])
+def test_remote_detector_validates_files(tmp_path, capsys, name, content):
+    path = tmp_path / name
+    path.write_text(content)
+    detector = _UnreachableDetector(str(tmp_path / "server.sock"), max_file_size=32)
+
+    with pytest.raises(SystemExit):
+        process_file(str(path), detector)
+
+    assert "File validation failed" in capsys.readouterr().out
+
+
+def test_remote_detector_reports_missing_file(tmp_path, capsys):
+    detector = _UnreachableDetector(str(tmp_path / "server.sock"))
+
+    with pytest.raises(SystemExit):
+        process_file(str(tmp_path / "missing.txt"), detector)
+
+    assert "File does not exist" in capsys.readouterr().out
+
+
+def test_probe_without_server_does_not_create_key(tmp_path, monkeypatch):
+    key_file = tmp_path / "keys" / "server.key"
+    monkeypatch.setattr(ai_detector, "SERVER_KEY_FILE", key_file)
+    detector = RemoteDetector(str(tmp_path / "server.sock"))
+
+    assert not detector.is_available()
+    assert not key_file.parent.exists()